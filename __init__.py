@@ -8,6 +8,6 @@ __author__ = "Your Name"
 __email__ = "your.email@example.com"
 __description__ = "A real-time flight tracking application with Vestaboard integration"
 
-from .vestaboard_api import VestaboardAPI
+from .vestaboard_api import AsyncVestaboardAPI, VestaboardAPI
 
-__all__ = ["VestaboardAPI"] 
\ No newline at end of file
+__all__ = ["VestaboardAPI", "AsyncVestaboardAPI"] 
\ No newline at end of file
@@ -5,19 +5,67 @@ This server provides a hybrid approach using OpenSky for initial aircraft detect
 and AeroDataBox for enriched aircraft metadata and flight details.
 """
 
-import json
+import atexit
+import orjson
 import os
 import math
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import csv
-import gzip
+import functools
+import hashlib
+import sys
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Optional
+from operator import itemgetter
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from cachetools import TTLCache
+
+# Log level comes from the environment; request-path diagnostics are DEBUG so they cost nothing by default
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'WARNING').upper(),
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson (datetimes are emitted as ISO 8601)."""
+    
+    # Same attribute names as Flask's default provider. Unlike the default, responses stay
+    # compact and unsorted even in debug mode; this is a machine-to-machine API.
+    compact = True
+    sort_keys = False
+    
+    def _option(self):
+        option = orjson.OPT_NON_STR_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self._option()).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self._option()), mimetype='application/json')
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for all routes
 
 # Configuration
@@ -27,16 +75,45 @@ VESTABOARD_CONFIG_FILE = 'vestaboard_config.json'
 OPENSKY_BASE_URL = 'https://opensky-network.org/api'
 AERODATABOX_BASE_URL = 'https://aerodatabox.p.rapidapi.com'
 
+# Geometry
+EARTH_RADIUS_KM = 6371
+KM_PER_DEGREE_LAT = 111.32
+# Beyond this latitude the flat-earth distance pre-filter is skipped (small-angle error too large)
+FLAT_EARTH_MAX_LAT = 70
+
+# Unit conversions for OpenSky state vectors
+FEET_PER_METER = 3.28084  # m to feet
+KNOTS_PER_MPS = 1.94384  # m/s to knots
+FPM_PER_MPS = 196.85  # m/s to ft/min
+
 # Cache for API responses to avoid rate limiting
-cache = {}
 CACHE_DURATION = 300  # 5 minutes in seconds
+CACHE_MAXSIZE = 10000
+cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_DURATION)
+cache_lock = threading.Lock()  # TTLCache is not thread-safe
+
+# Nearby-aircraft state fetches are cached per grid cell rather than per exact position,
+# so nearby callers share one OpenSky request. The fetch radius is padded by a cell
+# diagonal so the cell-centered box still covers the caller's circle.
+NEARBY_CACHE_GRID_DEGREES = 0.02  # roughly 2 km
+NEARBY_CACHE_GRID_PADDING_KM = NEARBY_CACHE_GRID_DEGREES * KM_PER_DEGREE_LAT * math.sqrt(2)
 
 # Aircraft metadata cache
-aircraft_metadata_cache = {}
+METADATA_CACHE_DURATION = 86400  # 1 day, so stale public API answers get refreshed
+METADATA_CACHE_MAXSIZE = 50000
+aircraft_metadata_cache = TTLCache(maxsize=METADATA_CACHE_MAXSIZE, ttl=METADATA_CACHE_DURATION)
+metadata_cache_lock = threading.Lock()
 METADATA_CACHE_FILE = 'aircraft_metadata_cache.json'
+METADATA_CACHE_FLUSH_DELAY = 10  # seconds to batch metadata cache writes before saving
+_metadata_cache_dirty = False
+_metadata_cache_flush_timer = None
 
 # Vestaboard tracking for aircraft entering geofence
-tracked_aircraft = set()  # Set of ICAO24 codes that have been notified
+# ICAO24 codes that have been notified; entries expire so aircraft seen again later re-notify
+TRACKED_AIRCRAFT_DURATION = 43200  # 12 hours in seconds
+TRACKED_AIRCRAFT_MAXSIZE = 10000
+tracked_aircraft = TTLCache(maxsize=TRACKED_AIRCRAFT_MAXSIZE, ttl=TRACKED_AIRCRAFT_DURATION)
+tracked_aircraft_lock = threading.Lock()
 VESTABOARD_ENABLED = False
 
 # Public aircraft databases
@@ -44,26 +121,107 @@ PUBLIC_APIS = [
     {
         'name': 'hexdb',
         'url': 'https://hexdb.io/api/v1/aircraft/{icao24}',
-        'timeout': 5
+        'timeout': 5,
+        'rate_limit': 1  # requests per second
     },
     {
         'name': 'adsbexchange',
         'url': 'https://public-api.adsbexchange.com/VirtualRadar/AircraftList.json?icao={icao24}',
-        'timeout': 5
+        'timeout': 5,
+        'rate_limit': 1  # requests per second
     }
 ]
 
+class TokenBucket:
+    """Thread-safe token bucket; consume() blocks until a token is available."""
+    
+    def __init__(self, capacity, refill_rate):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consume(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+            # Reserve a token; a negative balance is the wait for our turn
+            self.tokens -= 1
+            wait = -self.tokens / self.refill_rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+# One bucket per upstream host so we stay under their rate limits instead of retrying into them
+opensky_bucket = TokenBucket(capacity=5, refill_rate=1)
+# One aircraft details request fans out to up to 4 AeroDataBox calls (aircraft, flight and
+# both route airports), so the burst must cover them or every request stalls on the bucket
+AERODATABOX_BURST = 4
+aerodatabox_bucket = TokenBucket(capacity=AERODATABOX_BURST, refill_rate=1)
+public_api_buckets = {api['name']: TokenBucket(capacity=5, refill_rate=api['rate_limit']) for api in PUBLIC_APIS}
+
+def create_http_session():
+    """Create a requests session with a pooled, keep-alive HTTP adapter."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        # Back off exponentially only when the upstream signals overload
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 503))
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Thread pool for fanning out independent upstream API calls
+io_pool = ThreadPoolExecutor(max_workers=8)
+
+# Separate pool for batch detail requests, whose tasks wait on io_pool work themselves
+batch_pool = ThreadPoolExecutor(max_workers=8)
+# Max aircraft per batch details request. Each can need AERODATABOX_BURST AeroDataBox calls
+# at 1/s once the burst is spent, so 5 aircraft (about 16s) fit in the auto detector's 30s timeout
+BATCH_DETAILS_LIMIT = 5
+
+# Shared HTTP sessions so connections (and TLS handshakes) are reused across requests
+opensky_session = create_http_session()
+aerodatabox_session = create_http_session()
+public_api_session = create_http_session()
+
+# OpenSky OAuth2 token cache, shared across request threads
+_opensky_token = {'token': None, 'exp': 0}
+_opensky_token_lock = threading.Lock()
+OPENSKY_TOKEN_DEFAULT_LIFETIME = 1800  # seconds, used when the token response omits expires_in
+OPENSKY_TOKEN_EXPIRY_MARGIN = 30  # refresh this many seconds before the token expires
+
 OPENSKY_CSV_FILE = 'aircraftDatabase.csv'
-opensky_csv_db = None
+OPENSKY_DB_FILE = 'aircraftDatabase.sqlite'  # Indexed copy of the CSV, rebuilt when the CSV is newer
+# Columns kept from the OpenSky CSV, in the order they are stored
+OPENSKY_CSV_COLUMNS = ('manufacturername', 'model', 'registration', 'operator', 'serialnumber')
+opensky_db_available = None  # None until the on-disk database has been checked/built
+_opensky_db_lock = threading.Lock()
+_opensky_db_local = threading.local()  # sqlite3 connections can't be shared between threads
+
+def file_mtime(path):
+    """Return a file's modification time, or None if it doesn't exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
 def load_opensky_credentials():
-    """Load OpenSky API credentials from credentials file."""
+    """Load OpenSky API credentials, re-reading the file only when it changes."""
+    return read_opensky_credentials(file_mtime(CREDENTIALS_FILE))
+
+@functools.lru_cache(maxsize=1)
+def read_opensky_credentials(credentials_mtime):
+    """Load OpenSky API credentials from credentials file (cached per file modification time)."""
     try:
         if not os.path.exists(CREDENTIALS_FILE):
             raise FileNotFoundError(f"Credentials file '{CREDENTIALS_FILE}' not found")
         
-        with open(CREDENTIALS_FILE, 'r') as f:
-            credentials = json.load(f)
+        with open(CREDENTIALS_FILE, 'rb') as f:
+            credentials = orjson.loads(f.read())
         
         # Check for OAuth2 client credentials format (preferred)
         if 'clientId' in credentials and 'clientSecret' in credentials:
@@ -75,27 +233,32 @@ def load_opensky_credentials():
             raise ValueError("Credentials file must contain either 'clientId'/'clientSecret' (OAuth2) or 'username'/'password' (legacy) fields")
     
     except Exception as e:
-        print(f"Error loading OpenSky credentials: {e}")
+        logger.error("Error loading OpenSky credentials: %s", e)
         return None, None
 
 def load_aerodatabox_credentials():
-    """Load AeroDataBox API credentials from credentials file."""
+    """Load AeroDataBox API credentials, re-reading the files only when they change."""
+    return read_aerodatabox_credentials(file_mtime(AERODATABOX_CREDENTIALS_FILE), file_mtime(CREDENTIALS_FILE))
+
+@functools.lru_cache(maxsize=1)
+def read_aerodatabox_credentials(aerodatabox_mtime, credentials_mtime):
+    """Load AeroDataBox API credentials from credentials file (cached per file modification times)."""
     try:
         if not os.path.exists(AERODATABOX_CREDENTIALS_FILE):
             # If dedicated file doesn't exist, try to get from main credentials file
             if not os.path.exists(CREDENTIALS_FILE):
                 raise FileNotFoundError(f"Credentials files not found")
             
-            with open(CREDENTIALS_FILE, 'r') as f:
-                credentials = json.load(f)
+            with open(CREDENTIALS_FILE, 'rb') as f:
+                credentials = orjson.loads(f.read())
             
             if 'x-rapidapi-key' in credentials and 'x-rapidapi-host' in credentials:
                 return credentials['x-rapidapi-key'], credentials['x-rapidapi-host']
             else:
                 raise ValueError("Could not find AeroDataBox credentials")
         else:
-            with open(AERODATABOX_CREDENTIALS_FILE, 'r') as f:
-                credentials = json.load(f)
+            with open(AERODATABOX_CREDENTIALS_FILE, 'rb') as f:
+                credentials = orjson.loads(f.read())
             
             if 'x-rapidapi-key' in credentials and 'x-rapidapi-host' in credentials:
                 return credentials['x-rapidapi-key'], credentials['x-rapidapi-host']
@@ -103,154 +266,265 @@ def load_aerodatabox_credentials():
                 raise ValueError("AeroDataBox credentials file must contain 'x-rapidapi-key' and 'x-rapidapi-host' fields")
     
     except Exception as e:
-        print(f"Error loading AeroDataBox credentials: {e}")
+        logger.error("Error loading AeroDataBox credentials: %s", e)
         return None, None
 
 def load_aircraft_metadata_cache():
     """Load cached aircraft metadata from file."""
     try:
         if os.path.exists(METADATA_CACHE_FILE):
-            with open(METADATA_CACHE_FILE, 'r') as f:
-                return json.load(f)
+            with open(METADATA_CACHE_FILE, 'rb') as f:
+                return orjson.loads(f.read())
     except Exception as e:
-        print(f"Error loading metadata cache: {e}")
+        logger.error("Error loading metadata cache: %s", e)
     return {}
 
 def save_aircraft_metadata_cache():
     """Save aircraft metadata cache to file."""
     try:
-        with open(METADATA_CACHE_FILE, 'w') as f:
-            json.dump(aircraft_metadata_cache, f, indent=2)
+        with open(METADATA_CACHE_FILE, 'wb') as f:
+            with metadata_cache_lock:
+                snapshot = dict(aircraft_metadata_cache)
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+    except Exception as e:
+        logger.error("Error saving metadata cache: %s", e)
+
+def schedule_metadata_cache_save():
+    """Mark the metadata cache as changed and save it after a short delay, batching writes."""
+    global _metadata_cache_dirty, _metadata_cache_flush_timer
+    with metadata_cache_lock:
+        _metadata_cache_dirty = True
+        if _metadata_cache_flush_timer is None:
+            _metadata_cache_flush_timer = threading.Timer(METADATA_CACHE_FLUSH_DELAY, flush_aircraft_metadata_cache)
+            _metadata_cache_flush_timer.daemon = True
+            _metadata_cache_flush_timer.start()
+
+def flush_aircraft_metadata_cache():
+    """Save the metadata cache to file if it changed since the last save."""
+    global _metadata_cache_dirty, _metadata_cache_flush_timer
+    with metadata_cache_lock:
+        _metadata_cache_flush_timer = None
+        if not _metadata_cache_dirty:
+            return
+        _metadata_cache_dirty = False
+    save_aircraft_metadata_cache()
+
+# Don't lose pending metadata cache writes on shutdown
+atexit.register(flush_aircraft_metadata_cache)
+
+def iter_opensky_csv_rows():
+    """Stream (icao24, manufacturername, model, registration, operator, serialnumber) rows from the OpenSky CSV."""
+    with open(OPENSKY_CSV_FILE, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        icao_idx = header.index('icao24')
+        column_idx = [header.index(name) for name in OPENSKY_CSV_COLUMNS]
+        min_len = max(icao_idx, *column_idx) + 1
+        for row in reader:
+            if len(row) < min_len:
+                continue
+            icao = row[icao_idx].lower()
+            if icao:
+                yield (icao, *(row[i] for i in column_idx))
+
+def build_opensky_db():
+    """Build the SQLite lookup database from the OpenSky CSV."""
+    tmp_file = OPENSKY_DB_FILE + '.tmp'
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+    
+    conn = sqlite3.connect(tmp_file)
+    try:
+        # The build writes a throwaway file that is only swapped in once complete,
+        # so skip the rollback journal and fsyncs while rows stream in
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.execute(
+            'CREATE TABLE aircraft (icao24 TEXT PRIMARY KEY, '
+            'manufacturername TEXT, model TEXT, registration TEXT, operator TEXT, serialnumber TEXT) '
+            'WITHOUT ROWID'
+        )
+        conn.executemany('INSERT OR REPLACE INTO aircraft VALUES (?, ?, ?, ?, ?, ?)', iter_opensky_csv_rows())
+        conn.commit()
+        count = conn.execute('SELECT COUNT(*) FROM aircraft').fetchone()[0]
+    finally:
+        conn.close()
+    
+    # Swap the finished database into place so readers never see a partial build
+    os.replace(tmp_file, OPENSKY_DB_FILE)
+    return count
+
+def prepare_opensky_db():
+    """Make sure the OpenSky lookup database exists and is newer than the CSV."""
+    csv_exists = os.path.exists(OPENSKY_CSV_FILE)
+    try:
+        if os.path.exists(OPENSKY_DB_FILE) and (
+                not csv_exists or os.path.getmtime(OPENSKY_DB_FILE) >= os.path.getmtime(OPENSKY_CSV_FILE)):
+            return True
+        if not csv_exists:
+            logger.warning("OpenSky CSV file '%s' not found.", OPENSKY_CSV_FILE)
+            return False
+        count = build_opensky_db()
+        logger.info("Built OpenSky database '%s' with %d records.", OPENSKY_DB_FILE, count)
+        return True
     except Exception as e:
-        print(f"Error saving metadata cache: {e}")
+        logger.error("Error loading OpenSky CSV: %s", e)
+        return False
 
 def load_opensky_csv_db():
-    """Load OpenSky aircraft database CSV into a dictionary."""
-    global opensky_csv_db
-    if opensky_csv_db is not None:
-        return opensky_csv_db
-    db = {}
-    if os.path.exists(OPENSKY_CSV_FILE):
-        try:
-            with open(OPENSKY_CSV_FILE, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    icao = row.get('icao24', '').lower()
-                    if icao:
-                        db[icao] = row
-            print(f"Loaded OpenSky CSV database with {len(db)} records.")
-        except Exception as e:
-            print(f"Error loading OpenSky CSV: {e}")
-    else:
-        print(f"OpenSky CSV file '{OPENSKY_CSV_FILE}' not found.")
-    opensky_csv_db = db
-    return db
+    """Return this thread's connection to the OpenSky aircraft database, or None if unavailable."""
+    global opensky_db_available
+    conn = getattr(_opensky_db_local, 'conn', None)
+    if conn is not None:
+        return conn
+    
+    with _opensky_db_lock:
+        if opensky_db_available is None:
+            opensky_db_available = prepare_opensky_db()
+    if not opensky_db_available:
+        return None
+    
+    conn = sqlite3.connect(OPENSKY_DB_FILE)
+    _opensky_db_local.conn = conn
+    return conn
 
-def fetch_aircraft_metadata_from_public_apis(icao24):
-    """Fetch aircraft metadata from public APIs."""
-    for api in PUBLIC_APIS:
-        try:
-            url = api['url'].format(icao24=icao24)
-            response = requests.get(url, timeout=api['timeout'])
+def fetch_aircraft_metadata_from_public_api(api, icao24):
+    """Fetch aircraft metadata from a single public API."""
+    try:
+        url = api['url'].format(icao24=icao24)
+        public_api_buckets[api['name']].consume()
+        response = public_api_session.get(url, timeout=api['timeout'])
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
             
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Parse hexdb response
-                if api['name'] == 'hexdb' and 'aircraft' in data:
-                    aircraft = data['aircraft']
-                    return {
-                        'manufacturer': aircraft.get('manufacturer'),
-                        'model': aircraft.get('type'),
-                        'registration': aircraft.get('registration'),
-                        'operator': aircraft.get('operator'),
-                        'serialNumber': aircraft.get('serial_number')
-                    }
-                
-                # Parse adsbexchange response
-                elif api['name'] == 'adsbexchange' and 'acList' in data:
-                    for ac in data['acList']:
-                        if ac.get('Icao') == icao24:
-                            return {
-                                'manufacturer': ac.get('Man'),
-                                'model': ac.get('Mdl'),
-                                'registration': ac.get('Reg'),
-                                'operator': ac.get('Op'),
-                                'serialNumber': ac.get('Sqk')
-                            }
-                            
-        except Exception as e:
-            print(f"Error fetching from {api['name']}: {e}")
-            continue
+            # Parse hexdb response
+            if api['name'] == 'hexdb' and 'aircraft' in data:
+                aircraft = data['aircraft']
+                return {
+                    'manufacturer': aircraft.get('manufacturer'),
+                    'model': aircraft.get('type'),
+                    'registration': aircraft.get('registration'),
+                    'operator': aircraft.get('operator'),
+                    'serialNumber': aircraft.get('serial_number')
+                }
+            
+            # Parse adsbexchange response
+            elif api['name'] == 'adsbexchange' and 'acList' in data:
+                for ac in data['acList']:
+                    if ac.get('Icao') == icao24:
+                        return {
+                            'manufacturer': ac.get('Man'),
+                            'model': ac.get('Mdl'),
+                            'registration': ac.get('Reg'),
+                            'operator': ac.get('Op'),
+                            'serialNumber': ac.get('Sqk')
+                        }
+                        
+    except Exception as e:
+        logger.debug("Error fetching from %s: %s", api['name'], e)
+    
+    return None
+
+def fetch_aircraft_metadata_from_public_apis(icao24):
+    """
+    Fetch aircraft metadata from public APIs.
+    All APIs are queried concurrently; the first usable result in PUBLIC_APIS order wins.
+    """
+    futures = [io_pool.submit(fetch_aircraft_metadata_from_public_api, api, icao24) for api in PUBLIC_APIS]
+    for future in futures:
+        metadata = future.result()
+        if metadata:
+            return metadata
     
     return None
 
 def fetch_aircraft_metadata_from_opensky_csv(icao24):
-    db = load_opensky_csv_db()
-    icao = icao24.lower()
-    if icao in db:
-        row = db[icao]
+    """Look up aircraft metadata in the OpenSky database (icao24 must be lowercase)."""
+    conn = load_opensky_csv_db()
+    if conn is None:
+        return None
+    row = conn.execute(
+        'SELECT manufacturername, model, registration, operator, serialnumber FROM aircraft WHERE icao24 = ?',
+        (icao24,)
+    ).fetchone()
+    if row:
+        manufacturer, model, registration, operator, serial_number = row
         return {
-            'manufacturer': row.get('manufacturername'),
-            'model': row.get('model'),
-            'registration': row.get('registration'),
-            'operator': row.get('operator'),
-            'serialNumber': row.get('serialnumber')
+            'manufacturer': manufacturer,
+            'model': model,
+            'registration': registration,
+            'operator': operator,
+            'serialNumber': serial_number
         }
     return None
 
 def get_aircraft_metadata(icao24):
-    """Get aircraft metadata from cache or public APIs."""
+    """Get aircraft metadata from cache or public APIs (icao24 must be lowercase)."""
     # Check cache first
-    if icao24 in aircraft_metadata_cache:
-        return aircraft_metadata_cache[icao24]
+    with metadata_cache_lock:
+        cached = aircraft_metadata_cache.get(icao24)
+    if cached is not None:
+        return cached
     
     # Try public APIs
     metadata = fetch_aircraft_metadata_from_public_apis(icao24)
     
     if metadata:
         # Cache the result
-        aircraft_metadata_cache[icao24] = metadata
-        save_aircraft_metadata_cache()
+        with metadata_cache_lock:
+            aircraft_metadata_cache[icao24] = metadata
+        schedule_metadata_cache_save()
         return metadata
     
     # Try OpenSky CSV
     metadata = fetch_aircraft_metadata_from_opensky_csv(icao24)
     if metadata:
-        aircraft_metadata_cache[icao24] = metadata
-        save_aircraft_metadata_cache()
+        with metadata_cache_lock:
+            aircraft_metadata_cache[icao24] = metadata
+        schedule_metadata_cache_save()
         return metadata
     
     return None
 
 def get_opensky_token():
-    """Get OpenSky OAuth2 access token."""
-    try:
-        # Load credentials
-        client_id, client_secret = load_opensky_credentials()
-        
-        if not client_id or not client_secret:
-            raise Exception("OpenSky OAuth2 credentials not found")
-        
-        # Get access token
-        token_url = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
-        token_data = {
-            'grant_type': 'client_credentials',
-            'client_id': client_id,
-            'client_secret': client_secret
-        }
+    """Get OpenSky OAuth2 access token, reusing the cached token until shortly before it expires."""
+    global _opensky_token
+    
+    with _opensky_token_lock:
+        if _opensky_token['token'] and time.time() < _opensky_token['exp'] - OPENSKY_TOKEN_EXPIRY_MARGIN:
+            return _opensky_token['token']
         
-        response = requests.post(token_url, data=token_data, timeout=30)
+        try:
+            # Load credentials
+            client_id, client_secret = load_opensky_credentials()
+            
+            if not client_id or not client_secret:
+                raise Exception("OpenSky OAuth2 credentials not found")
+            
+            # Get access token
+            token_url = "https://auth.opensky-network.org/auth/realms/opensky-network/protocol/openid-connect/token"
+            token_data = {
+                'grant_type': 'client_credentials',
+                'client_id': client_id,
+                'client_secret': client_secret
+            }
+            
+            response = opensky_session.post(token_url, data=token_data, timeout=30)
+            
+            if response.status_code == 200:
+                token_info = orjson.loads(response.content)
+                access_token = token_info.get('access_token')
+                if access_token:
+                    expires_in = token_info.get('expires_in', OPENSKY_TOKEN_DEFAULT_LIFETIME)
+                    _opensky_token = {'token': access_token, 'exp': time.time() + expires_in}
+                return access_token
+            else:
+                raise Exception(f"Failed to get access token: {response.status_code} - {response.text}")
         
-        if response.status_code == 200:
-            token_info = response.json()
-            return token_info.get('access_token')
-        else:
-            raise Exception(f"Failed to get access token: {response.status_code} - {response.text}")
-    
-    except Exception as e:
-        print(f"Error getting OpenSky token: {e}")
-        return None
+        except Exception as e:
+            logger.error("Error getting OpenSky token: %s", e)
+            return None
 
 def make_opensky_request(endpoint, params=None):
     """Make a request to the OpenSky API using OAuth2."""
@@ -268,7 +542,8 @@ def make_opensky_request(endpoint, params=None):
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(
+        opensky_bucket.consume()
+        response = opensky_session.get(
             url,
             params=params,
             headers=headers,
@@ -276,6 +551,9 @@ def make_opensky_request(endpoint, params=None):
         )
         
         if response.status_code == 401:
+            # Drop the cached token so the next request mints a fresh one
+            with _opensky_token_lock:
+                _opensky_token['exp'] = 0
             raise Exception("Invalid OpenSky credentials or expired token")
         elif response.status_code == 429:
             raise Exception("Rate limit exceeded. Please try again later.")
@@ -284,7 +562,7 @@ def make_opensky_request(endpoint, params=None):
         elif response.status_code != 200:
             raise Exception(f"OpenSky API error: {response.status_code} - {response.text}")
         
-        return response.json()
+        return orjson.loads(response.content)
     
     except requests.exceptions.Timeout:
         raise Exception("Request to OpenSky API timed out")
@@ -293,6 +571,15 @@ def make_opensky_request(endpoint, params=None):
     except requests.exceptions.RequestException as e:
         raise Exception(f"Request error: {str(e)}")
 
+@functools.lru_cache(maxsize=1)
+def get_aerodatabox_headers(api_key, api_host):
+    """Build the AeroDataBox request headers once per set of credentials."""
+    return {
+        'x-rapidapi-key': api_key,
+        'x-rapidapi-host': api_host,
+        'User-Agent': 'Flight-Tracker-Proxy/1.0'
+    }
+
 def make_aerodatabox_request(endpoint, params=None):
     """Make a request to the AeroDataBox API."""
     try:
@@ -303,16 +590,11 @@ def make_aerodatabox_request(endpoint, params=None):
         
         url = f"{AERODATABOX_BASE_URL}/{endpoint}"
         
-        headers = {
-            'x-rapidapi-key': api_key,
-            'x-rapidapi-host': api_host,
-            'User-Agent': 'Flight-Tracker-Proxy/1.0'
-        }
-        
-        response = requests.get(
+        aerodatabox_bucket.consume()
+        response = aerodatabox_session.get(
             url,
             params=params,
-            headers=headers,
+            headers=get_aerodatabox_headers(api_key, api_host),
             timeout=30
         )
         
@@ -325,7 +607,7 @@ def make_aerodatabox_request(endpoint, params=None):
         elif response.status_code != 200:
             raise Exception(f"AeroDataBox API error: {response.status_code} - {response.text}")
         
-        return response.json()
+        return orjson.loads(response.content)
     
     except requests.exceptions.Timeout:
         raise Exception("Request to AeroDataBox API timed out")
@@ -334,28 +616,44 @@ def make_aerodatabox_request(endpoint, params=None):
     except requests.exceptions.RequestException as e:
         raise Exception(f"Request error: {str(e)}")
 
+def snap_to_grid(value, step=NEARBY_CACHE_GRID_DEGREES):
+    """Snap a coordinate to the center of its cache grid cell."""
+    return round(round(value / step) * step, 6)
+
+def get_cached(cache_key, default=None):
+    """Get data from cache without fetching; returns default if not cached or expired."""
+    with cache_lock:
+        return cache.get(cache_key, default)
+
 def get_cached_or_fetch(cache_key, fetch_function, *args, **kwargs):
     """Get data from cache or fetch new data if not cached or expired."""
-    now = time.time()
-    
-    if cache_key in cache:
-        cached_data, timestamp = cache[cache_key]
-        if now - timestamp < CACHE_DURATION:
-            return cached_data
+    with cache_lock:
+        try:
+            return cache[cache_key]
+        except KeyError:
+            pass
     
     # Fetch new data
     data = fetch_function(*args, **kwargs)
-    cache[cache_key] = (data, now)
+    with cache_lock:
+        cache[cache_key] = data
     return data
 
 # OpenSky API functions
+@functools.lru_cache(maxsize=1024)
+def km_per_degree_lon(lat_quarter_degrees):
+    """Kilometers per degree of longitude at a latitude given in quarter degrees."""
+    return KM_PER_DEGREE_LAT * math.cos(math.radians(lat_quarter_degrees / 4))
+
 def fetch_opensky_states(lat, lon, radius_km):
     """Fetch state vectors for aircraft within a radius."""
     # Convert radius to a bounding box
     # 1 degree of latitude is approximately 111 km
     # 1 degree of longitude is approximately 111*cos(lat) km
-    lat_km = 111.32
-    lon_km = 111.32 * math.cos(math.radians(lat))
+    # Latitude is rounded away from the equator to a quarter degree so the cached
+    # scale is reused across requests and the box never comes out too narrow
+    lat_km = KM_PER_DEGREE_LAT
+    lon_km = km_per_degree_lon(min(math.ceil(abs(lat) * 4), 359))
     
     lat_delta = radius_km / lat_km
     lon_delta = radius_km / lon_km
@@ -376,49 +674,70 @@ def fetch_opensky_states(lat, lon, radius_km):
     
     return make_opensky_request('states/all', params)
 
+def get_tracked_aircraft():
+    """Return a snapshot of the ICAO24 codes that have already been notified."""
+    with tracked_aircraft_lock:
+        return frozenset(tracked_aircraft)
+
+# slots=True needs Python 3.10+; older interpreters get a regular dataclass
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
+class Aircraft:
+    """An aircraft near the requested position; orjson serializes it with these field names."""
+    icao24: str
+    callsign: Optional[str]
+    country: Optional[str]
+    latitude: float
+    longitude: float
+    altitude: Optional[float]
+    speed: Optional[float]
+    heading: Optional[float]
+    verticalRate: Optional[float]
+    onGround: Optional[bool]
+    distance: float
+    # Set per response by with_notified_flags; cached lists always leave it False
+    notified: bool = False
+    # Filled in by enrichment from cached AeroDataBox data
+    manufacturer: Optional[str] = None
+    model: Optional[str] = None
+    registration: Optional[str] = None
+    operator: Optional[str] = None
+    owner: Optional[str] = None
+    flightNumber: Optional[str] = None
+    route: Optional[dict] = None
+
 def process_opensky_states(states_data, center_lat, center_lon, radius_km):
     """Process and filter OpenSky state vectors."""
     if not states_data or 'states' not in states_data or not states_data['states']:
         return []
     
-    result = []
-    for state in states_data['states']:
-        # OpenSky states format: [icao24, callsign, country, ..., longitude, latitude, ...]
-        icao24 = state[0]
-        callsign = state[1].strip() if state[1] else None
-        country = state[2]
-        longitude = state[5]
-        latitude = state[6]
-        
-        # Skip if no position data
-        if longitude is None or latitude is None:
-            continue
-        
-        # Calculate actual distance to verify it's in the radius
-        distance = calculate_distance(center_lat, center_lon, latitude, longitude)
-        if distance > radius_km:
-            continue
-        
-        # Basic aircraft data from OpenSky
-        aircraft_data = {
-            'icao24': icao24,
-            'callsign': callsign,
-            'country': country,
-            'latitude': latitude,
-            'longitude': longitude,
-            'altitude': state[7] * 3.28084 if state[7] else None,  # Convert m to feet
-            'speed': state[9] * 1.94384 if state[9] else None,  # Convert m/s to knots
-            'heading': state[10],
-            'verticalRate': state[11] * 196.85 if state[11] else None,  # Convert m/s to ft/min
-            'onGround': state[8],
-            'distance': round(distance, 1)
-        }
-        
-        result.append(aircraft_data)
-    
-    # Sort by distance from center point
-    result.sort(key=lambda x: x['distance'])
-    return result
+    # OpenSky states format: [icao24, callsign, country, ..., longitude, latitude, ...]
+    # Skip states without position data
+    states = [state for state in states_data['states'] if state[5] is not None and state[6] is not None]
+    
+    # Calculate distances in one batch to verify each aircraft is in the radius
+    distances = calculate_distances_within(center_lat, center_lon, radius_km, [(state[6], state[5]) for state in states])
+    
+    # Sort the in-range states by distance from center point before building any output
+    in_range = [(distance, state) for state, distance in zip(states, distances) if distance is not None]
+    in_range.sort(key=itemgetter(0))
+    
+    # Basic aircraft data from OpenSky, built in a single pass over the sorted states
+    return [
+        Aircraft(
+            icao24=state[0],
+            callsign=state[1].strip() if state[1] else None,
+            country=state[2],
+            latitude=state[6],
+            longitude=state[5],
+            altitude=state[7] * FEET_PER_METER if state[7] else None,
+            speed=state[9] * KNOTS_PER_MPS if state[9] else None,
+            heading=state[10],
+            verticalRate=state[11] * FPM_PER_MPS if state[11] else None,
+            onGround=state[8],
+            distance=round(distance, 1)
+        )
+        for distance, state in in_range
+    ]
 
 # AeroDataBox API functions
 def fetch_aircraft_details(icao):
@@ -436,22 +755,65 @@ def fetch_airport_details(icao_code):
     endpoint = f"v1/airports/icao/{icao_code}"
     return make_aerodatabox_request(endpoint)
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """Calculate distance between two points in kilometers."""
-    R = 6371  # Earth's radius in kilometers
-    
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+def extract_route_airports(flight_info):
+    """Return (departure, arrival) airport ICAO codes from flight info, or (None, None)."""
+    try:
+        return flight_info['departure']['airport']['icao'], flight_info['arrival']['airport']['icao']
+    except (KeyError, TypeError):
+        return None, None
+
+def haversine(center_lat_rad, cos_center_lat, center_lon_rad, lat, lon):
+    """
+    Calculate distance in kilometers from a center point to (lat, lon).
+    The center point is given pre-converted to radians, along with the cosine of its latitude.
+    """
+    lat_rad = math.radians(lat)
+    dlat = lat_rad - center_lat_rad
+    dlon = math.radians(lon) - center_lon_rad
     
-    dlon = lon2_rad - lon1_rad
-    dlat = lat2_rad - lat1_rad
+    a = math.sin(dlat/2)**2 + cos_center_lat * math.cos(lat_rad) * math.sin(dlon/2)**2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def calculate_distances_within(center_lat, center_lon, radius_km, points):
+    """
+    Calculate distances in kilometers from a center point to a list of (lat, lon) points.
+    Returns None for points outside radius_km.
     
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    A flat-earth approximation is accurate to well under 10% at these radii, so points
+    clearly inside or outside the circle are classified from it directly and only points
+    near the boundary get the exact haversine distance. Above FLAT_EARTH_MAX_LAT the
+    approximation's longitude error grows past that band, so every point gets haversine.
+    """
+    center_lat_rad = math.radians(center_lat)
+    cos_center_lat = math.cos(center_lat_rad)
+    center_lon_rad = math.radians(center_lon)
+    
+    lon_km = KM_PER_DEGREE_LAT * cos_center_lat
+    if abs(center_lat) <= FLAT_EARTH_MAX_LAT:
+        inner_sq = (radius_km * 0.9) ** 2
+        outer_sq = (radius_km * 1.1) ** 2
+    else:
+        # Empty inner circle and unbounded outer one: nothing is classified by the approximation
+        inner_sq = -1.0
+        outer_sq = math.inf
+    
+    distances = []
+    for lat, lon in points:
+        dy = (lat - center_lat) * KM_PER_DEGREE_LAT
+        dx = (lon - center_lon) * lon_km
+        d2 = dx*dx + dy*dy
+        
+        if d2 <= inner_sq:
+            distance = math.sqrt(d2)
+        elif d2 <= outer_sq:
+            distance = haversine(center_lat_rad, cos_center_lat, center_lon_rad, lat, lon)
+            if distance > radius_km:
+                distance = None
+        else:
+            distance = None
+        distances.append(distance)
     
-    return R * c
+    return distances
 
 # Import the existing VestaboardAPI class
 from vestaboard_api import VestaboardAPI
@@ -467,12 +829,12 @@ class VestaboardClient:
         try:
             success = self.api.send_message(text)
             if success:
-                print(f"✅ Vestaboard message sent successfully!")
+                logger.debug("✅ Vestaboard message sent successfully!")
             else:
-                print(f"❌ Failed to send Vestaboard message")
+                logger.warning("❌ Failed to send Vestaboard message")
             return success
         except Exception as e:
-            print(f"❌ Error sending Vestaboard message: {str(e)}")
+            logger.error("❌ Error sending Vestaboard message: %s", e)
             return False
     
     def test_connection(self):
@@ -480,7 +842,7 @@ class VestaboardClient:
         try:
             return self.api.test_connection()
         except Exception as e:
-            print(f"❌ Vestaboard connection test failed: {str(e)}")
+            logger.warning("❌ Vestaboard connection test failed: %s", e)
             return False
 
 def load_vestaboard_config():
@@ -489,11 +851,11 @@ def load_vestaboard_config():
     
     try:
         if not os.path.exists(VESTABOARD_CONFIG_FILE):
-            print(f"⚠️ Vestaboard config file not found: {VESTABOARD_CONFIG_FILE}")
+            logger.warning("⚠️ Vestaboard config file not found: %s", VESTABOARD_CONFIG_FILE)
             return None
         
-        with open(VESTABOARD_CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        with open(VESTABOARD_CONFIG_FILE, 'rb') as f:
+            config = orjson.loads(f.read())
         
         if 'vestaboard' in config:
             vesta_config = config['vestaboard']
@@ -504,40 +866,80 @@ def load_vestaboard_config():
                 VESTABOARD_ENABLED = True
                 return VestaboardClient(api_key, local_url)
             else:
-                print("⚠️ Vestaboard config missing apiKey or localUrl")
+                logger.warning("⚠️ Vestaboard config missing apiKey or localUrl")
                 return None
         else:
-            print("⚠️ Vestaboard config file missing 'vestaboard' section")
+            logger.warning("⚠️ Vestaboard config file missing 'vestaboard' section")
             return None
     
     except Exception as e:
-        print(f"❌ Error loading Vestaboard config: {str(e)}")
+        logger.error("❌ Error loading Vestaboard config: %s", e)
         return None
 
+# Vestaboard client, loaded once at startup
+VESTA_CLIENT = load_vestaboard_config()
+
+# Last Vestaboard connection test result, reused for status polls within the probe interval
+VESTABOARD_PROBE_INTERVAL = 30  # seconds
+_vesta_probe_cache = {'ts': 0, 'ok': False}
+_vesta_probe_lock = threading.Lock()
+
+def probe_vestaboard(vesta_client):
+    """Return whether the Vestaboard is reachable, testing the connection at most once per probe interval."""
+    with _vesta_probe_lock:
+        if time.monotonic() - _vesta_probe_cache['ts'] < VESTABOARD_PROBE_INTERVAL:
+            return _vesta_probe_cache['ok']
+    
+    ok = vesta_client.test_connection()
+    with _vesta_probe_lock:
+        _vesta_probe_cache['ts'] = time.monotonic()
+        _vesta_probe_cache['ok'] = ok
+    return ok
+
+def reset_vestaboard_probe():
+    """Force the next probe_vestaboard call to test the connection again."""
+    with _vesta_probe_lock:
+        _vesta_probe_cache['ts'] = 0
+
+def reload_vestaboard_client():
+    """Re-read the Vestaboard config file and replace the shared client."""
+    global VESTA_CLIENT, VESTABOARD_ENABLED
+    
+    VESTABOARD_ENABLED = False
+    VESTA_CLIENT = load_vestaboard_config()
+    reset_vestaboard_probe()
+    return VESTA_CLIENT
+
 def format_flight_notification(aircraft_data):
     """
     Format aircraft data for Vestaboard display
     Returns a formatted string suitable for the 6x22 character display
     """
     # Debug logging to see what data we're receiving
-    print(f"🔍 Formatting notification for aircraft {aircraft_data.get('icao24', 'unknown')}")
-    print(f"   All available fields: {list(aircraft_data.keys())}")
-    print(f"   Callsign: {aircraft_data.get('callsign', 'N/A')}")
-    print(f"   Manufacturer: {aircraft_data.get('manufacturer', 'N/A')}")
-    print(f"   Model: {aircraft_data.get('model', 'N/A')}")
-    print(f"   Registration: {aircraft_data.get('registration', 'N/A')}")
-    print(f"   Operator: {aircraft_data.get('operator', 'N/A')}")
-    print(f"   Owner: {aircraft_data.get('owner', 'N/A')}")
-    print(f"   AircraftType: {aircraft_data.get('aircraftType', 'N/A')}")
-    print(f"   RegisteredOwner: {aircraft_data.get('registeredOwner', 'N/A')}")
-    print(f"   Country: {aircraft_data.get('country', 'N/A')}")
-    
-    # Extract key information - use both possible field names
-    callsign = aircraft_data.get('callsign', 'UNKNOWN').strip()
-    
-    # Try to get altitude and heading from different possible sources
-    altitude = aircraft_data.get('altitude', 0)
-    heading = aircraft_data.get('heading', 0)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 Formatting notification for aircraft %s", aircraft_data.get('icao24', 'unknown'))
+        logger.debug("   All available fields: %s", list(aircraft_data.keys()))
+        for label, key in (('Callsign', 'callsign'), ('Manufacturer', 'manufacturer'), ('Model', 'model'),
+                           ('Registration', 'registration'), ('Operator', 'operator'), ('Owner', 'owner'),
+                           ('AircraftType', 'aircraftType'), ('RegisteredOwner', 'registeredOwner'),
+                           ('Country', 'country')):
+            logger.debug("   %s: %s", label, aircraft_data.get(key, 'N/A'))
+    
+    # Extract key information once - use both possible field names
+    # Text fields may be present but null (unenriched Aircraft), so fall back with `or`
+    get = aircraft_data.get
+    callsign = (get('callsign') or 'UNKNOWN').strip()
+    altitude = get('altitude', 0)
+    heading = get('heading', 0)
+    speed = get('speed', 0)
+    manufacturer = get('manufacturer') or ''
+    model = get('model') or ''
+    registration = get('registration') or ''
+    registered_owner = get('registeredOwner') or ''
+    # Check for operator in multiple possible field names
+    operator = get('operator') or registered_owner
+    owner = get('owner') or registered_owner
+    country = get('country') or ''
     
     # Handle 'N/A' values properly
     if altitude == 'N/A' or altitude is None:
@@ -547,7 +949,7 @@ def format_flight_notification(aircraft_data):
     
     # If not found as numbers, try parsing from position string
     if not altitude or not heading:
-        position_str = aircraft_data.get('position', '')
+        position_str = get('position', '')
         if position_str:
             try:
                 # Extract altitude (e.g., "22750 ft")
@@ -560,7 +962,6 @@ def format_flight_notification(aircraft_data):
                 pass
     
     # Try to get speed from different possible sources
-    speed = aircraft_data.get('speed', 0)
     if speed == 'N/A' or speed is None:
         speed = 0
     if isinstance(speed, str):
@@ -569,13 +970,9 @@ def format_flight_notification(aircraft_data):
         except:
             speed = 0
     
-    # Try to get manufacturer and model from different possible sources
-    manufacturer = aircraft_data.get('manufacturer', '')
-    model = aircraft_data.get('model', '')
-    
-    # If not found, try parsing from aircraftType (this is the main source based on console output)
+    # If manufacturer or model is not found, try parsing from aircraftType (this is the main source based on console output)
     if not manufacturer or not model:
-        aircraft_type_str = aircraft_data.get('aircraftType', '')
+        aircraft_type_str = get('aircraftType', '')
         if aircraft_type_str:
             if ':' in aircraft_type_str:
                 parts = aircraft_type_str.split(':', 1)
@@ -584,12 +981,6 @@ def format_flight_notification(aircraft_data):
             else:
                 model = aircraft_type_str
     
-    registration = aircraft_data.get('registration', '')
-    # Check for operator in multiple possible field names
-    operator = aircraft_data.get('operator', '') or aircraft_data.get('registeredOwner', '')
-    owner = aircraft_data.get('owner', '') or aircraft_data.get('registeredOwner', '')
-    country = aircraft_data.get('country', '')
-    
     # Format altitude, speed, and heading (0 decimal places)
     try:
         alt_str = f"{int(altitude):,} ft" if altitude and altitude != 'N/A' else "N/A"
@@ -634,11 +1025,11 @@ def format_flight_notification(aircraft_data):
             owner_operator = f"{owner_operator} 🟠🟠"
     
     # Truncate long strings to fit display (22 characters max)
-    callsign = callsign[:22] if len(callsign) > 22 else callsign
-    registration = registration[:22] if len(registration) > 22 else registration
-    owner_operator = owner_operator[:22] if len(owner_operator) > 22 else owner_operator
-    aircraft_type = aircraft_type[:22] if len(aircraft_type) > 22 else aircraft_type
-    country = country[:22] if len(country) > 22 else country
+    callsign = callsign[:22]
+    registration = registration[:22]
+    owner_operator = owner_operator[:22]
+    aircraft_type = aircraft_type[:22]
+    country = country[:22]
     
     # Format the message for 6x22 display
     lines = [
@@ -657,7 +1048,7 @@ def notify_new_aircraft(aircraft_data):
     Send notification to Vestaboard for new aircraft entering geofence
     Only sends notification once per aircraft per session
     """
-    global tracked_aircraft, VESTABOARD_ENABLED
+    global tracked_aircraft
     
     if not VESTABOARD_ENABLED:
         return False
@@ -667,31 +1058,37 @@ def notify_new_aircraft(aircraft_data):
         return False
     
     # Check if we've already notified about this aircraft
-    if icao24 in tracked_aircraft:
-        return False
+    with tracked_aircraft_lock:
+        if icao24 in tracked_aircraft:
+            return False
     
-    # Load Vestaboard client
-    vesta_client = load_vestaboard_config()
+    vesta_client = VESTA_CLIENT
     if not vesta_client:
         return False
     
-    # Test connection
-    if not vesta_client.test_connection():
-        print("❌ Cannot connect to Vestaboard")
-        return False
-    
     # Format and send notification
     notification_text = format_flight_notification(aircraft_data)
     
     if vesta_client.send_message(notification_text):
         # Mark this aircraft as notified
-        tracked_aircraft.add(icao24)
-        print(f"✅ Vestaboard notification sent for aircraft {icao24}")
+        with tracked_aircraft_lock:
+            tracked_aircraft[icao24] = True
+        logger.info("✅ Vestaboard notification sent for aircraft %s", icao24)
         return True
     else:
-        print(f"❌ Failed to send Vestaboard notification for aircraft {icao24}")
+        logger.warning("❌ Failed to send Vestaboard notification for aircraft %s", icao24)
+        # Reload the client so the next notification picks up any config changes
+        reload_vestaboard_client()
         return False
 
+def _json_error(message, status, icao24=None):
+    """Build a timestamped JSON error response tuple."""
+    body = {'error': message}
+    if icao24 is not None:
+        body['icao24'] = icao24
+    body['timestamp'] = datetime.now()
+    return jsonify(body), status
+
 @app.route('/')
 def index():
     """Root endpoint - provides API information."""
@@ -701,6 +1098,7 @@ def index():
         'endpoints': {
             '/api/aircraft/details': 'Get aircraft details by ICAO',
             '/api/aircraft': 'Get aircraft near a location',
+            '/api/aircraft/stream': 'Get aircraft near a location as NDJSON',
             '/api/health': 'Health check endpoint'
         }
     })
@@ -712,138 +1110,324 @@ def health_check():
     aerodatabox_key, aerodatabox_host = load_aerodatabox_credentials()
     
     # Check Vestaboard status
-    vesta_client = load_vestaboard_config()
     vestaboard_connected = False
-    if vesta_client:
-        vestaboard_connected = vesta_client.test_connection()
+    if VESTA_CLIENT:
+        vestaboard_connected = probe_vestaboard(VESTA_CLIENT)
     
     return jsonify({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': datetime.now(),
         'opensky_credentials_loaded': opensky_client_id is not None and opensky_client_secret is not None,
         'aerodatabox_credentials_loaded': aerodatabox_key is not None and aerodatabox_host is not None,
         'vestaboard_enabled': VESTABOARD_ENABLED,
         'vestaboard_connected': vestaboard_connected,
-        'tracked_aircraft_count': len(tracked_aircraft),
+        'tracked_aircraft_count': len(get_tracked_aircraft()),
         'apis': ['OpenSky', 'AeroDataBox', 'Vestaboard']
     })
 
-@app.route('/api/aircraft/details')
+def build_aircraft_details(icao24):
+    """Assemble the details response for one aircraft; icao24 must be lowercase."""
+    logger.debug("Fetching details for aircraft %s", icao24)
+    # Aircraft details and current flight are independent, so fetch them concurrently
+    details_cache_key = f"aircraft_details_{icao24}"
+    flight_cache_key = f"aircraft_flight_{icao24}"
+    details_future = io_pool.submit(
+        get_cached_or_fetch,
+        details_cache_key,
+        fetch_aircraft_details,
+        icao24
+    )
+    flight_future = io_pool.submit(
+        get_cached_or_fetch,
+        flight_cache_key,
+        fetch_aircraft_flights,
+        icao24
+    )
+    aircraft_details = details_future.result()
+    # Fallback: If AeroDataBox returns nothing useful, try hexdb
+    if not aircraft_details or not any([
+        aircraft_details.get('model'),
+        aircraft_details.get('manufacturer'),
+        aircraft_details.get('registration')
+    ]):
+        logger.debug("AeroDataBox returned no data for %s, trying hexdb...", icao24)
+        aircraft_details = get_aircraft_metadata(icao24)
+    flight_info = flight_future.result()
+    route_info = None
+    if flight_info:
+        departure_airport, arrival_airport = extract_route_airports(flight_info)
+        if departure_airport and arrival_airport:
+            dep_cache_key = f"airport_{departure_airport}"
+            departure_future = io_pool.submit(
+                get_cached_or_fetch,
+                dep_cache_key,
+                fetch_airport_details,
+                departure_airport
+            )
+            arr_cache_key = f"airport_{arrival_airport}"
+            arrival_future = io_pool.submit(
+                get_cached_or_fetch,
+                arr_cache_key,
+                fetch_airport_details,
+                arrival_airport
+            )
+            departure_details = departure_future.result()
+            arrival_details = arrival_future.result()
+            route_info = {
+                'from': departure_airport,
+                'to': arrival_airport,
+                'fromName': departure_details.get('fullName') if departure_details else None,
+                'toName': arrival_details.get('fullName') if arrival_details else None,
+                'departureTime': flight_info.get('departure', {}).get('scheduledTime', {}).get('utc'),
+                'arrivalTime': flight_info.get('arrival', {}).get('scheduledTime', {}).get('utc')
+            }
+    current_position = None
+    if flight_info and 'position' in flight_info:
+        position = flight_info.get('position', {})
+        current_position = {
+            'latitude': position.get('latitude'),
+            'longitude': position.get('longitude'),
+            'altitude': position.get('altitude', {}).get('feet'),
+            'speed': position.get('groundSpeed', {}).get('knots'),
+            'heading': position.get('heading'),
+            'verticalRate': position.get('verticalRate'),
+            'timestamp': position.get('reportedAt')
+        }
+    meta = None
+    if aircraft_details:
+        meta = {
+            'model': aircraft_details.get('model'),
+            'manufacturer': aircraft_details.get('manufacturer'),
+            'registration': aircraft_details.get('registration'),
+            'serialNumber': aircraft_details.get('serialNumber'),
+            'operator': aircraft_details.get('operator'),
+            'age': aircraft_details.get('age'),
+            'callsign': flight_info.get('callsign') if flight_info else None,
+            'flightNumber': flight_info.get('number') if flight_info else None
+        }
+        if current_position:
+            meta.update({
+                'altitude': current_position.get('altitude'),
+                'speed': current_position.get('speed'),
+                'heading': current_position.get('heading'),
+                'verticalRate': current_position.get('verticalRate'),
+                'onGround': current_position.get('altitude', 0) <= 100
+            })
+    response_data = {
+        'icao24': icao24,
+        'meta': meta,
+        'route': route_info,
+        'position': current_position,
+        'rawData': {
+            'aircraft': aircraft_details,
+            'flight': flight_info
+        },
+        'timestamp': datetime.now()
+    }
+    logger.debug("Successfully fetched details for %s", icao24)
+    return response_data
+
+def build_aircraft_details_or_error(icao24):
+    """Like build_aircraft_details, but reports a failure as an error entry for batch responses."""
+    try:
+        return build_aircraft_details(icao24)
+    except Exception as e:
+        error_message = str(e)
+        logger.error("Error fetching details for %s: %s", icao24, error_message)
+        return {
+            'error': error_message,
+            'icao24': icao24,
+            'timestamp': datetime.now()
+        }
+
+def batch_aircraft_details_response(icao_values):
+    """Build the response for a multi-aircraft details request, keyed by ICAO24."""
+    # Normalize and de-duplicate; downstream lookups and cache keys expect lowercase ICAO24
+    icao_list = list(dict.fromkeys(icao.strip().lower() for icao in icao_values if icao.strip()))
+    if not icao_list:
+        return jsonify({'error': 'Missing icao24 parameter'}), 400
+    if len(icao_list) > BATCH_DETAILS_LIMIT:
+        return jsonify({'error': f'At most {BATCH_DETAILS_LIMIT} icao24 values per request'}), 400
+    
+    logger.debug("Fetching details for %d aircraft", len(icao_list))
+    # Runs on its own pool: each lookup submits work to io_pool and waits on it
+    return jsonify(dict(zip(icao_list, batch_pool.map(build_aircraft_details_or_error, icao_list))))
+
+@app.route('/api/aircraft/details', methods=['GET', 'POST'])
 def get_aircraft_details():
     """
     Get detailed aircraft information.
     
-    Query Parameters:
-    - icao24: ICAO24 identifier for the aircraft (required)
+    Query Parameters (GET):
+    - icao24: ICAO24 identifier for the aircraft (required), or a comma-separated
+      list of identifiers to fetch several aircraft in one request
+    
+    JSON Body (POST):
+    - icao24s: list of ICAO24 identifiers
     
     Returns:
-    JSON object with aircraft details
+    JSON object with aircraft details, or for a list, an object keyed by ICAO24
     """
-    icao24 = request.args.get('icao24')
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        icao_values = data.get('icao24s')
+        if not isinstance(icao_values, list) or not all(isinstance(icao, str) for icao in icao_values):
+            return jsonify({'error': 'icao24s must be a list of ICAO24 strings'}), 400
+        return batch_aircraft_details_response(icao_values)
+    
+    # Normalize once here; downstream lookups and cache keys expect lowercase ICAO24
+    icao24 = request.args.get('icao24', '').lower()
     
     if not icao24:
         return jsonify({'error': 'Missing icao24 parameter'}), 400
     
+    if ',' in icao24:
+        return batch_aircraft_details_response(icao24.split(','))
+    
     try:
-        print(f"Fetching details for aircraft {icao24}")
-        details_cache_key = f"aircraft_details_{icao24}"
-        aircraft_details = get_cached_or_fetch(
-            details_cache_key,
-            fetch_aircraft_details,
-            icao24
-        )
-        # Fallback: If AeroDataBox returns nothing useful, try hexdb
-        if not aircraft_details or not any([
-            aircraft_details.get('model'),
-            aircraft_details.get('manufacturer'),
-            aircraft_details.get('registration')
-        ]):
-            print(f"AeroDataBox returned no data for {icao24}, trying hexdb...")
-            aircraft_details = get_aircraft_metadata(icao24)
-        flight_cache_key = f"aircraft_flight_{icao24}"
-        flight_info = get_cached_or_fetch(
-            flight_cache_key,
-            fetch_aircraft_flights,
-            icao24
-        )
-        route_info = None
-        if flight_info and 'departure' in flight_info and 'arrival' in flight_info:
-            departure_airport = flight_info.get('departure', {}).get('airport', {}).get('icao')
-            arrival_airport = flight_info.get('arrival', {}).get('airport', {}).get('icao')
-            if departure_airport and arrival_airport:
-                dep_cache_key = f"airport_{departure_airport}"
-                departure_details = get_cached_or_fetch(
-                    dep_cache_key,
-                    fetch_airport_details,
-                    departure_airport
-                )
-                arr_cache_key = f"airport_{arrival_airport}"
-                arrival_details = get_cached_or_fetch(
-                    arr_cache_key,
-                    fetch_airport_details,
-                    arrival_airport
-                )
-                route_info = {
-                    'from': departure_airport,
-                    'to': arrival_airport,
-                    'fromName': departure_details.get('fullName') if departure_details else None,
-                    'toName': arrival_details.get('fullName') if arrival_details else None,
-                    'departureTime': flight_info.get('departure', {}).get('scheduledTime', {}).get('utc'),
-                    'arrivalTime': flight_info.get('arrival', {}).get('scheduledTime', {}).get('utc')
-                }
-        current_position = None
-        if flight_info and 'position' in flight_info:
-            position = flight_info.get('position', {})
-            current_position = {
-                'latitude': position.get('latitude'),
-                'longitude': position.get('longitude'),
-                'altitude': position.get('altitude', {}).get('feet'),
-                'speed': position.get('groundSpeed', {}).get('knots'),
-                'heading': position.get('heading'),
-                'verticalRate': position.get('verticalRate'),
-                'timestamp': position.get('reportedAt')
-            }
-        meta = None
-        if aircraft_details:
-            meta = {
-                'model': aircraft_details.get('model'),
-                'manufacturer': aircraft_details.get('manufacturer'),
-                'registration': aircraft_details.get('registration'),
-                'serialNumber': aircraft_details.get('serialNumber'),
-                'operator': aircraft_details.get('operator'),
-                'age': aircraft_details.get('age'),
-                'callsign': flight_info.get('callsign') if flight_info else None,
-                'flightNumber': flight_info.get('number') if flight_info else None
-            }
-            if current_position:
-                meta.update({
-                    'altitude': current_position.get('altitude'),
-                    'speed': current_position.get('speed'),
-                    'heading': current_position.get('heading'),
-                    'verticalRate': current_position.get('verticalRate'),
-                    'onGround': current_position.get('altitude', 0) <= 100
-                })
-        response_data = {
-            'icao24': icao24,
-            'meta': meta,
-            'route': route_info,
-            'position': current_position,
-            'rawData': {
-                'aircraft': aircraft_details,
-                'flight': flight_info
-            },
-            'timestamp': datetime.now().isoformat()
-        }
-        print(f"Successfully fetched details for {icao24}")
-        return jsonify(response_data)
+        return jsonify(build_aircraft_details(icao24))
     except Exception as e:
         error_message = str(e)
-        print(f"Error fetching details for {icao24}: {error_message}")
-        return jsonify({
-            'error': error_message,
-            'icao24': icao24,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        logger.error("Error fetching details for %s: %s", icao24, error_message)
+        return _json_error(error_message, 500, icao24)
+
+def parse_location_args(args):
+    """
+    Parse and validate the lat/lon/radius query parameters.
+    Returns ((lat, lon, radius), None) on success or (None, error_response) on failure.
+    """
+    # Get request parameters
+    lat = args.get('lat')
+    lon = args.get('lon')
+    radius = args.get('radius', default=3)
+    
+    if not lat or not lon:
+        return None, (jsonify({'error': 'Missing lat/lon parameters'}), 400)
+    
+    # Convert to float
+    try:
+        lat = float(lat)
+        lon = float(lon)
+        radius = float(radius)
+    except ValueError:
+        return None, (jsonify({'error': 'Invalid parameter format'}), 400)
+    
+    # Validate parameter ranges
+    if not (-90 <= lat <= 90):
+        return None, (jsonify({'error': 'Latitude must be between -90 and 90'}), 400)
+    if not (-180 <= lon <= 180):
+        return None, (jsonify({'error': 'Longitude must be between -180 and 180'}), 400)
+    if not (1 <= radius <= 100):
+        return None, (jsonify({'error': 'Radius must be between 1 and 100 km'}), 400)
+    
+    return (lat, lon, radius), None
+
+ENRICHMENT_LIMIT = 5  # nearest aircraft enriched from cached AeroDataBox data
+
+def find_nearby_aircraft(lat, lon, radius):
+    """
+    Return (aircraft_list, etag) for aircraft within radius km of (lat, lon), nearest first.
+    The ETag identifies the list's content so clients can poll with If-None-Match.
+    """
+    # Serve the fully enriched list if this location was answered recently
+    enriched_cache_key = f"enriched_nearby_{lat}_{lon}_{radius}"
+    cached_result = get_cached(enriched_cache_key)
+    if cached_result is None:
+        cached_result = fetch_enriched_nearby_aircraft(lat, lon, radius, enriched_cache_key)
+    
+    # Notifications happen while the list is cached, so flag them per response
+    return with_notified_flags(*cached_result)
+
+def with_notified_flags(aircraft_list, etag):
+    """
+    Flag aircraft that are currently tracked as notified, without touching the cached list.
+    The notified ICAOs are folded into the ETag so a new notification changes it.
+    """
+    tracked = get_tracked_aircraft()
+    notified_icaos = [aircraft.icao24 for aircraft in aircraft_list if aircraft.icao24 in tracked]
+    if not notified_icaos:
+        return aircraft_list, etag
+    
+    aircraft_list = [replace(aircraft, notified=True) if aircraft.icao24 in tracked else aircraft
+                     for aircraft in aircraft_list]
+    etag = hashlib.sha1(f"{etag}:{','.join(notified_icaos)}".encode()).hexdigest()
+    return aircraft_list, etag
+
+def fetch_enriched_nearby_aircraft(lat, lon, radius, enriched_cache_key):
+    """
+    Build and cache (aircraft_list, etag) for a location from OpenSky and cached AeroDataBox data.
+    Every aircraft is stored with notified=False; see with_notified_flags.
+    """
+    # Fetch flights from OpenSky API for the surrounding grid cell
+    logger.debug("Fetching aircraft near position (%s, %s) with radius %skm", lat, lon, radius)
+    grid_lat = snap_to_grid(lat)
+    grid_lon = snap_to_grid(lon)
+    grid_radius = math.ceil(radius)
+    cache_key = f"nearby_aircraft_{grid_lat}_{grid_lon}_{grid_radius}"
+    
+    opensky_data = get_cached_or_fetch(
+        cache_key,
+        fetch_opensky_states,
+        grid_lat, grid_lon, grid_radius + NEARBY_CACHE_GRID_PADDING_KM
+    )
+    
+    # Process and filter OpenSky data against the exact position and radius
+    aircraft_list = process_opensky_states(opensky_data, lat, lon, radius)
+    
+    if aircraft_list:
+        logger.debug("Found %d aircraft near position", len(aircraft_list))
+    
+    # Enrich the first few aircraft with AeroDataBox data if possible
+    # We limit to avoid hitting rate limits
+    for aircraft in aircraft_list[:ENRICHMENT_LIMIT]:
+        try:
+            icao24 = aircraft.icao24
+            # Check if we already have this data cached
+            details_cache_key = f"aircraft_details_{icao24}"
+            flight_cache_key = f"aircraft_flight_{icao24}"
+            
+            aircraft_details = get_cached(details_cache_key)
+            if aircraft_details:
+                aircraft.manufacturer = aircraft_details.get('manufacturer')
+                aircraft.model = aircraft_details.get('model')
+                aircraft.registration = aircraft_details.get('registration')
+                aircraft.operator = aircraft_details.get('operator')
+                aircraft.owner = aircraft_details.get('owner')
+            
+            flight_info = get_cached(flight_cache_key)
+            if flight_info:
+                aircraft.flightNumber = flight_info.get('number')
+                
+                # Extract route if available
+                departure, arrival = extract_route_airports(flight_info)
+                if departure and arrival:
+                    aircraft.route = {
+                        'from': departure,
+                        'to': arrival
+                    }
+        except Exception as e:
+            logger.warning("Error enriching aircraft data for %s: %s", aircraft.icao24, e)
+            # Continue with the next aircraft if one fails
+            continue
+    
+    # Vestaboard notifications are now handled in the frontend
+    # where the enriched data is available
+    
+    # Hashed once here; cache hits reuse it
+    etag = hashlib.sha1(orjson.dumps(aircraft_list)).hexdigest()
+    
+    with cache_lock:
+        cache[enriched_cache_key] = (aircraft_list, etag)
+    
+    return aircraft_list, etag
+
+def not_modified_response(etag):
+    """Return a 304 response if the request's If-None-Match already has etag, otherwise None."""
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
 
 @app.route('/api/aircraft')
 def get_nearby_aircraft():
@@ -853,148 +1437,99 @@ def get_nearby_aircraft():
     Query Parameters:
     - lat: Latitude (required)
     - lon: Longitude (required)
-    - radius: Radius in kilometers (optional, default 10)
+    - radius: Radius in kilometers (optional, default 3)
     
     Returns:
     JSON array with aircraft information
     """
+    location, error_response = parse_location_args(request.args)
+    if error_response:
+        return error_response
+    
     try:
-        # Get request parameters
-        lat = request.args.get('lat')
-        lon = request.args.get('lon')
-        radius = request.args.get('radius', default=3)
-        
-        if not lat or not lon:
-            return jsonify({'error': 'Missing lat/lon parameters'}), 400
-        
-        # Convert to float
-        try:
-            lat = float(lat)
-            lon = float(lon)
-            radius = float(radius)
-        except ValueError:
-            return jsonify({'error': 'Invalid parameter format'}), 400
-        
-        # Validate parameter ranges
-        if not (-90 <= lat <= 90):
-            return jsonify({'error': 'Latitude must be between -90 and 90'}), 400
-        if not (-180 <= lon <= 180):
-            return jsonify({'error': 'Longitude must be between -180 and 180'}), 400
-        if not (1 <= radius <= 100):
-            return jsonify({'error': 'Radius must be between 1 and 100 km'}), 400
-        
-        # Fetch flights from OpenSky API
-        print(f"Fetching aircraft near position ({lat}, {lon}) with radius {radius}km")
-        cache_key = f"nearby_aircraft_{lat}_{lon}_{radius}"
-        
-        opensky_data = get_cached_or_fetch(
-            cache_key,
-            fetch_opensky_states,
-            lat, lon, radius
-        )
-        
-        # Process and filter OpenSky data
-        aircraft_list = process_opensky_states(opensky_data, lat, lon, radius)
-        
-        if not aircraft_list:
-            return jsonify([])
-        
-        print(f"Found {len(aircraft_list)} aircraft near position")
+        aircraft_list, etag = find_nearby_aircraft(*location)
+        response = not_modified_response(etag)
+        if response:
+            return response
         
-        # Enrich the first few aircraft with AeroDataBox data if possible
-        # We limit to avoid hitting rate limits
-        enrichment_limit = min(5, len(aircraft_list))
-        for i in range(enrichment_limit):
-            try:
-                icao24 = aircraft_list[i]['icao24']
-                # Check if we already have this data cached
-                details_cache_key = f"aircraft_details_{icao24}"
-                flight_cache_key = f"aircraft_flight_{icao24}"
-                
-                if details_cache_key in cache:
-                    aircraft_details, _ = cache[details_cache_key]
-                    if aircraft_details:
-                        aircraft_list[i]['manufacturer'] = aircraft_details.get('manufacturer')
-                        aircraft_list[i]['model'] = aircraft_details.get('model')
-                        aircraft_list[i]['registration'] = aircraft_details.get('registration')
-                        aircraft_list[i]['operator'] = aircraft_details.get('operator')
-                        aircraft_list[i]['owner'] = aircraft_details.get('owner')
-                
-                if flight_cache_key in cache:
-                    flight_info, _ = cache[flight_cache_key]
-                    if flight_info:
-                        aircraft_list[i]['flightNumber'] = flight_info.get('number')
-                        
-                        # Extract route if available
-                        if 'departure' in flight_info and 'arrival' in flight_info:
-                            departure = flight_info.get('departure', {}).get('airport', {}).get('icao')
-                            arrival = flight_info.get('arrival', {}).get('airport', {}).get('icao')
-                            
-                            if departure and arrival:
-                                aircraft_list[i]['route'] = {
-                                    'from': departure,
-                                    'to': arrival
-                                }
-            except Exception as e:
-                print(f"Error enriching aircraft data for {aircraft_list[i]['icao24']}: {str(e)}")
-                # Continue with the next aircraft if one fails
-                continue
+        response = jsonify(aircraft_list)
+        response.set_etag(etag)
+        response.headers['X-Aircraft-Count'] = str(len(aircraft_list))
+        return response
+    
+    except Exception as e:
+        error_message = str(e)
+        logger.error("Error fetching nearby aircraft: %s", error_message)
         
-        # Vestaboard notifications are now handled in the frontend
-        # where the enriched data is available
-                
-        return jsonify(aircraft_list)
+        return _json_error(error_message, 500)
+
+@app.route('/api/aircraft/stream')
+def stream_nearby_aircraft():
+    """
+    Get aircraft near a specific location as newline-delimited JSON.
+    
+    Takes the same query parameters as /api/aircraft.
+    
+    Returns:
+    One JSON object per line (application/x-ndjson), nearest aircraft first
+    """
+    location, error_response = parse_location_args(request.args)
+    if error_response:
+        return error_response
+    
+    try:
+        aircraft_list, etag = find_nearby_aircraft(*location)
     
     except Exception as e:
         error_message = str(e)
-        print(f"Error fetching nearby aircraft: {error_message}")
+        logger.error("Error fetching nearby aircraft: %s", error_message)
         
-        return jsonify({
-            'error': error_message,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return _json_error(error_message, 500)
+    
+    # A strong ETag must differ per representation; the NDJSON body is not the JSON array
+    etag = f"{etag}-ndjson"
+    response = not_modified_response(etag)
+    if response:
+        return response
+    
+    response = Response(
+        (orjson.dumps(aircraft, option=orjson.OPT_APPEND_NEWLINE) for aircraft in aircraft_list),
+        mimetype='application/x-ndjson',
+        headers={'X-Aircraft-Count': str(len(aircraft_list))}
+    )
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/vestaboard/test')
 def test_vestaboard():
     """Test Vestaboard connection and send a test message."""
     try:
-        vesta_client = load_vestaboard_config()
+        vesta_client = VESTA_CLIENT
         if not vesta_client:
-            return jsonify({
-                'error': 'Vestaboard not configured',
-                'timestamp': datetime.now().isoformat()
-            }), 400
+            return _json_error('Vestaboard not configured', 400)
         
         # Test connection
         if not vesta_client.test_connection():
-            return jsonify({
-                'error': 'Cannot connect to Vestaboard',
-                'timestamp': datetime.now().isoformat()
-            }), 500
+            return _json_error('Cannot connect to Vestaboard', 500)
         
         # Send test message
-        test_message = "FLIGHT TRACKER TEST\nVestaboard Connected!\nReady for notifications\n" + datetime.now().strftime("%H:%M:%S")
+        now = datetime.now()
+        test_message = "FLIGHT TRACKER TEST\nVestaboard Connected!\nReady for notifications\n" + now.strftime("%H:%M:%S")
         
         if vesta_client.send_message(test_message):
             return jsonify({
                 'status': 'success',
                 'message': 'Test message sent successfully',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now
             })
         else:
-            return jsonify({
-                'error': 'Failed to send test message',
-                'timestamp': datetime.now().isoformat()
-            }), 500
+            return _json_error('Failed to send test message', 500)
     
     except Exception as e:
         error_message = str(e)
-        print(f"Error testing Vestaboard: {error_message}")
+        logger.error("Error testing Vestaboard: %s", error_message)
         
-        return jsonify({
-            'error': error_message,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return _json_error(error_message, 500)
 
 @app.route('/api/vestaboard/notify', methods=['POST'])
 def vestaboard_notify():
@@ -1016,49 +1551,58 @@ def vestaboard_notify():
             return jsonify({
                 'status': 'success',
                 'message': 'Notification sent successfully',
-                'timestamp': datetime.now().isoformat()
+                'timestamp': datetime.now()
             })
         else:
-            return jsonify({
-                'error': 'Failed to send notification',
-                'timestamp': datetime.now().isoformat()
-            }), 500
+            return _json_error('Failed to send notification', 500)
     
     except Exception as e:
         error_message = str(e)
-        print(f"Error sending Vestaboard notification: {error_message}")
+        logger.error("Error sending Vestaboard notification: %s", error_message)
         
-        return jsonify({
-            'error': error_message,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+        return _json_error(error_message, 500)
 
 @app.route('/api/vestaboard/status')
 def vestaboard_status():
     """Get Vestaboard status and tracked aircraft count."""
     try:
-        vesta_client = load_vestaboard_config()
+        vesta_client = VESTA_CLIENT
         vestaboard_connected = False
         
         if vesta_client:
-            vestaboard_connected = vesta_client.test_connection()
+            vestaboard_connected = probe_vestaboard(vesta_client)
         
+        notified_icaos = get_tracked_aircraft()
         return jsonify({
             'vestaboard_enabled': VESTABOARD_ENABLED,
             'vestaboard_connected': vestaboard_connected,
-            'tracked_aircraft_count': len(tracked_aircraft),
-            'tracked_aircraft': list(tracked_aircraft)[:10],  # Show first 10
-            'timestamp': datetime.now().isoformat()
+            'tracked_aircraft_count': len(notified_icaos),
+            'tracked_aircraft': list(notified_icaos)[:10],  # Show first 10
+            'timestamp': datetime.now()
         })
     
     except Exception as e:
         error_message = str(e)
-        print(f"Error getting Vestaboard status: {error_message}")
+        logger.error("Error getting Vestaboard status: %s", error_message)
         
+        return _json_error(error_message, 500)
+
+@app.route('/api/vestaboard/reload', methods=['POST'])
+def vestaboard_reload():
+    """Reload the Vestaboard configuration file without restarting the server."""
+    try:
+        vesta_client = reload_vestaboard_client()
         return jsonify({
-            'error': error_message,
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'vestaboard_enabled': VESTABOARD_ENABLED,
+            'vestaboard_connected': probe_vestaboard(vesta_client) if vesta_client else False,
+            'timestamp': datetime.now()
+        })
+    
+    except Exception as e:
+        error_message = str(e)
+        logger.error("Error reloading Vestaboard config: %s", error_message)
+        
+        return _json_error(error_message, 500)
 
 @app.errorhandler(404)
 def not_found(error):
@@ -1091,8 +1635,7 @@ if __name__ == '__main__':
         print(f"   Aircraft enrichment features will be limited.")
     
     # Check Vestaboard configuration on startup
-    vesta_client = load_vestaboard_config()
-    if vesta_client and vesta_client.test_connection():
+    if VESTA_CLIENT and probe_vestaboard(VESTA_CLIENT):
         print(f"✅ Vestaboard connected and ready for flight notifications!")
     elif VESTABOARD_ENABLED:
         print("⚠️ WARNING: Vestaboard enabled but connection failed!")
@@ -1105,9 +1648,11 @@ if __name__ == '__main__':
     print("   GET  /api/health           - Health check")
     print("   GET  /api/aircraft/details - Aircraft details by ICAO")
     print("   GET  /api/aircraft         - Aircraft near a location")
+    print("   GET  /api/aircraft/stream  - Aircraft near a location (NDJSON)")
     print("   GET  /api/vestaboard/test  - Test Vestaboard connection")
     print("   GET  /api/vestaboard/status - Vestaboard status")
     print("   POST /api/vestaboard/notify - Send notification from frontend")
+    print("   POST /api/vestaboard/reload - Reload Vestaboard config")
     
     print("\n🔀 Hybrid API Strategy:")
     print("   - Using OpenSky for geofence aircraft detection")
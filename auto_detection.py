@@ -7,11 +7,18 @@ without requiring a browser to be open.
 Production-ready version with enhanced error handling and logging.
 """
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
 import os
+import random
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 
@@ -27,13 +34,74 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Configuration - can be overridden by environment variables
-BASE_URL = os.getenv('AIR_OVERHEAD_BASE_URL', "http://localhost:5000")
+BASE_URL = os.getenv('AIR_OVERHEAD_BASE_URL', "http://127.0.0.1:5000")  # IP literal skips the localhost lookup
 YOUR_LAT = float(os.getenv('AIR_OVERHEAD_LAT', 51.5995))  # Match frontend default
 YOUR_LON = float(os.getenv('AIR_OVERHEAD_LON', -0.5545))
 YOUR_RADIUS = float(os.getenv('AIR_OVERHEAD_RADIUS', 5))  # Match geofence radius
-CHECK_INTERVAL = int(os.getenv('AIR_OVERHEAD_REFRESH', 1))  # seconds between checks
-MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+CHECK_INTERVAL = int(os.getenv('AIR_OVERHEAD_REFRESH', 5))  # seconds between checks
+# Floor between aircraft fetches; repeat polls are cheap (server grid cache, ETag/304), so by
+# default it only guards against CHECK_INTERVAL being set lower than a fetch is worth
+MIN_FETCH_INTERVAL = int(os.getenv('AIR_OVERHEAD_MIN_FETCH_INTERVAL', max(1, CHECK_INTERVAL)))
+MAX_CHECK_INTERVAL = 300  # seconds; cap for the backoff when the sky is empty or the server errors
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.3  # seconds; urllib3 doubles the wait after each failed attempt
+DETAILS_BATCH_SIZE = 5  # server limit (BATCH_DETAILS_LIMIT), sized so its AeroDataBox lookups beat the timeout
+PROCESS_NICENESS = 10  # niceness increment applied when run standalone
+
+# Shared HTTP session so keep-alive connections to the server and hexdb are reused
+# Transient failures are retried with exponential backoff here, not in the callers
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    # raise_on_status=False hands the last response back so callers still see the HTTP status
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        raise_on_status=False
+    )
+)
+http_session.mount('http://', _http_adapter)
+http_session.mount('https://', _http_adapter)
+# Our own server answers 500 when OpenSky fails or rate-limits, so retrying that only repeats
+# the upstream error; POSTs to it are only retried when the connection itself failed
+http_session.mount(f"{BASE_URL}/", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET'],
+        raise_on_status=False
+    )
+))
+# A notification that reached the server may already be on the board, so only retry failed connects
+http_session.mount(f"{BASE_URL}/api/vestaboard/notify", HTTPAdapter(
+    max_retries=Retry(total=MAX_RETRIES, read=False, backoff_factor=RETRY_BACKOFF_FACTOR)
+))
+# A timed-out batch details request is still running its upstream lookups, so resending it
+# only queues the same work again; likewise only retry failed connects
+http_session.mount(f"{BASE_URL}/api/aircraft/details", HTTPAdapter(
+    max_retries=Retry(total=MAX_RETRIES, read=False, backoff_factor=RETRY_BACKOFF_FACTOR)
+))
+
+# The aircraft poll never changes, so its URL and query string are built once
+AIRCRAFT_STREAM_REQUEST = http_session.prepare_request(requests.Request(
+    'GET',
+    f"{BASE_URL}/api/aircraft/stream",
+    params={'lat': YOUR_LAT, 'lon': YOUR_LON, 'radius': YOUR_RADIUS}
+))
+
+# hexdb asks clients to keep to about one request per second
+HEXDB_MIN_INTERVAL = 1.0  # seconds
+_hexdb_next_slot = 0.0
+_hexdb_lock = threading.Lock()
+
+# Worker threads for independent requests: startup checks and per-aircraft public-source lookups
+details_pool = ThreadPoolExecutor(max_workers=8)
 
 # Statistics tracking
 stats = {
@@ -44,134 +112,232 @@ stats = {
     'last_aircraft_count': 0
 }
 
+# Time of the last successful aircraft fetch (time.monotonic)
+last_fetch_ts = None
+# ETag of the last aircraft list, sent back so an unchanged list comes back as 304 Not Modified
+last_etag = None
+# Aircraft list behind last_etag, kept so failed notifications can be retried on a 304
+last_aircraft_list = []
+
 # Track aircraft that have been notified to avoid duplicates
-notified_aircraft = set()
+# Bounded LRU: the oldest entries are evicted one at a time once the limit is reached
+NOTIFIED_AIRCRAFT_MAXSIZE = 500
+notified_aircraft = OrderedDict()
+
+def mark_notified(icao24):
+    """Record an aircraft as notified, evicting the oldest entry when full"""
+    notified_aircraft[icao24] = None
+    notified_aircraft.move_to_end(icao24)
+    if len(notified_aircraft) > NOTIFIED_AIRCRAFT_MAXSIZE:
+        notified_aircraft.popitem(last=False)
 
 def check_server_health():
     """Check if the Flask server is running and healthy"""
     try:
-        response = requests.get(f"{BASE_URL}/api/health", timeout=10)
+        response = http_session.get(f"{BASE_URL}/api/health", timeout=10)
         if response.status_code == 200:
-            return True, response.json()
+            return True, orjson.loads(response.content)
         return False, None
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"Server health check failed: {str(e)}")
         return False, None
 
 def check_for_aircraft():
-    """Check for aircraft in the specified area with retry logic"""
-    for attempt in range(MAX_RETRIES):
-        try:
-            url = f"{BASE_URL}/api/aircraft?lat={YOUR_LAT}&lon={YOUR_LON}&radius={YOUR_RADIUS}"
-            response = requests.get(url, timeout=30)
-            
+    """Check for aircraft in the specified area; returns the count, or None on error"""
+    global last_fetch_ts, last_etag, last_aircraft_list
+    
+    # Reuse the last result while the server would still be serving the same cached data
+    if last_fetch_ts is not None and time.monotonic() - last_fetch_ts < MIN_FETCH_INTERVAL:
+        return stats['last_aircraft_count']
+    
+    try:
+        request = AIRCRAFT_STREAM_REQUEST
+        if last_etag:
+            # Copy so the shared request keeps its original headers
+            request = request.copy()
+            request.headers['If-None-Match'] = last_etag
+        with http_session.send(request, timeout=30, stream=True) as response:
             if response.status_code == 200:
-                aircraft_list = response.json()
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                
-                if aircraft_list:
-                    logger.info(f"[{timestamp}] Found {len(aircraft_list)} aircraft")
-                    stats['aircraft_detected'] += len(aircraft_list)
-                    stats['last_aircraft_count'] = len(aircraft_list)
-                    
-                    # Trigger Vestaboard notifications for new aircraft
-                    trigger_vestaboard_notifications(aircraft_list)
-                    
-                    return len(aircraft_list)
+                last_etag = response.headers.get('ETag')
+                # The server sends the count up front, so an empty sky needs no body at all
+                if response.headers.get('X-Aircraft-Count') == '0':
+                    aircraft_list = []
                 else:
-                    logger.debug(f"[{timestamp}] No aircraft detected")
-                    stats['last_aircraft_count'] = 0
-                    return 0
-            else:
-                logger.error(f"HTTP {response.status_code} error from server")
-                stats['errors'] += 1
-                return None
+                    # One aircraft per line, decoded as the lines arrive
+                    aircraft_list = [orjson.loads(line) for line in response.iter_lines() if line]
+                last_aircraft_list = aircraft_list
+        
+        if response.status_code == 304:
+            # Same aircraft as last time; only retry any whose notification has not gone through
+            last_fetch_ts = time.monotonic()
+            if any(aircraft.get('icao24') not in notified_aircraft for aircraft in last_aircraft_list):
+                trigger_vestaboard_notifications(last_aircraft_list)
+            return stats['last_aircraft_count']
+        
+        if response.status_code == 200:
+            last_fetch_ts = time.monotonic()
+            timestamp = time.strftime("%H:%M:%S")
+            
+            if aircraft_list:
+                logger.info(f"[{timestamp}] Found {len(aircraft_list)} aircraft")
+                stats['aircraft_detected'] += len(aircraft_list)
+                stats['last_aircraft_count'] = len(aircraft_list)
                 
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Connection error (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
-            else:
-                stats['errors'] += 1
-                return None
-        except Exception as e:
-            logger.error(f"Unexpected error (attempt {attempt + 1}/{MAX_RETRIES}): {str(e)}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
+                # Trigger Vestaboard notifications for new aircraft
+                trigger_vestaboard_notifications(aircraft_list)
+                
+                return len(aircraft_list)
             else:
-                stats['errors'] += 1
-                return None
+                logger.debug(f"[{timestamp}] No aircraft detected")
+                stats['last_aircraft_count'] = 0
+                return 0
+        else:
+            logger.error(f"HTTP {response.status_code} error from server")
+            stats['errors'] += 1
+            return None
+            
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # The session adapter has already retried transient failures
+        logger.error(f"Error checking for aircraft: {str(e)}")
+        stats['errors'] += 1
+        return None
+
+def enrich_aircraft_details(icao24, data):
+    """Build enriched aircraft data from a details response, falling back to public sources"""
+    # Handle the actual API response structure
+    meta = data.get('meta', {})
+    if meta is None:
+        meta = {}
     
-    return None
+    # Extract the rich aircraft data
+    enriched_data = {
+        'icao24': icao24,
+        'registration': meta.get('registration', 'N/A'),
+        'manufacturer': meta.get('manufacturer', 'N/A'),
+        'model': meta.get('model', 'N/A'),
+        'operator': meta.get('operator', 'N/A'),
+        'serialNumber': meta.get('serialNumber', 'N/A'),
+        'age': meta.get('age', 'N/A'),
+        'callsign': meta.get('callsign', 'N/A'),
+        'flightNumber': meta.get('flightNumber', 'N/A'),
+        'altitude': meta.get('altitude', 'N/A'),
+        'speed': meta.get('speed', 'N/A'),
+        'heading': meta.get('heading', 'N/A')
+    }
+    
+    # Check if we need to try public sources (same logic as web interface)
+    needs_public_lookup = (
+        enriched_data['manufacturer'] == 'N/A' and 
+        enriched_data['model'] == 'N/A' and 
+        enriched_data['registration'] == 'N/A'
+    )
+    
+    if needs_public_lookup:
+        logger.info(f"   Backend data incomplete, trying public sources...")
+        public_data = fetch_public_aircraft_data(icao24)
+        if public_data:
+            # Merge public data with backend data
+            enriched_data.update(public_data)
+            logger.info(f"   ✅ Got public data: {public_data.get('manufacturer', 'N/A')} {public_data.get('model', 'N/A')}")
+        else:
+            logger.info(f"   ⚠️  No public data available")
+    
+    logger.info(f"   DETAILS: {enriched_data['registration']} | {enriched_data['manufacturer']} {enriched_data['model']}")
+    logger.info(f"   OPERATOR: {enriched_data['operator']} | FLIGHT: {enriched_data['flightNumber']}")
+    
+    return enriched_data
 
 def get_aircraft_details(icao24):
     """Fetch detailed aircraft information including registration, manufacturer, model, operator"""
     try:
         url = f"{BASE_URL}/api/aircraft/details?icao24={icao24}"
-        response = requests.get(url, timeout=15)
+        response = http_session.get(url, timeout=15)
         
         if response.status_code == 200:
-            data = response.json()
-            
-            # Handle the actual API response structure
-            meta = data.get('meta', {})
-            if meta is None:
-                meta = {}
-            
-            # Extract the rich aircraft data
-            enriched_data = {
-                'icao24': icao24,
-                'registration': meta.get('registration', 'N/A'),
-                'manufacturer': meta.get('manufacturer', 'N/A'),
-                'model': meta.get('model', 'N/A'),
-                'operator': meta.get('operator', 'N/A'),
-                'serialNumber': meta.get('serialNumber', 'N/A'),
-                'age': meta.get('age', 'N/A'),
-                'callsign': meta.get('callsign', 'N/A'),
-                'flightNumber': meta.get('flightNumber', 'N/A'),
-                'altitude': meta.get('altitude', 'N/A'),
-                'speed': meta.get('speed', 'N/A'),
-                'heading': meta.get('heading', 'N/A')
-            }
-            
-            # Check if we need to try public sources (same logic as web interface)
-            needs_public_lookup = (
-                enriched_data['manufacturer'] == 'N/A' and 
-                enriched_data['model'] == 'N/A' and 
-                enriched_data['registration'] == 'N/A'
-            )
-            
-            if needs_public_lookup:
-                logger.info(f"   Backend data incomplete, trying public sources...")
-                public_data = fetch_public_aircraft_data(icao24)
-                if public_data:
-                    # Merge public data with backend data
-                    enriched_data.update(public_data)
-                    logger.info(f"   ✅ Got public data: {public_data.get('manufacturer', 'N/A')} {public_data.get('model', 'N/A')}")
-                else:
-                    logger.info(f"   ⚠️  No public data available")
-            
-            logger.info(f"   DETAILS: {enriched_data['registration']} | {enriched_data['manufacturer']} {enriched_data['model']}")
-            logger.info(f"   OPERATOR: {enriched_data['operator']} | FLIGHT: {enriched_data['flightNumber']}")
-            
-            return enriched_data
+            return enrich_aircraft_details(icao24, orjson.loads(response.content))
         else:
             logger.warning(f"Failed to get details for {icao24}: HTTP {response.status_code}")
             return None
             
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"Error fetching details for {icao24}: {str(e)}")
         return None
 
+def get_aircraft_details_batch(icao_list):
+    """Fetch details for several aircraft in one request; returns a dict keyed by ICAO24"""
+    if len(icao_list) < 2:
+        return {icao24: get_aircraft_details(icao24) for icao24 in icao_list}
+    if len(icao_list) > DETAILS_BATCH_SIZE:
+        results = {}
+        for i in range(0, len(icao_list), DETAILS_BATCH_SIZE):
+            results.update(get_aircraft_details_batch(icao_list[i:i + DETAILS_BATCH_SIZE]))
+        return results
+    
+    try:
+        url = f"{BASE_URL}/api/aircraft/details"
+        response = http_session.post(url, json={'icao24s': icao_list}, timeout=30)
+        
+        if response.status_code != 200:
+            logger.warning(f"Failed to get batch details: HTTP {response.status_code}")
+            return {}
+        
+        batch = orjson.loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Error fetching batch details: {str(e)}")
+        return {}
+    
+    # Public-source fallbacks are per aircraft, so enrich them concurrently
+    results = {}
+    futures = {}
+    for icao24 in icao_list:
+        data = batch.get(icao24)
+        if not data or 'error' in data:
+            logger.warning(f"Failed to get details for {icao24}: {data.get('error') if data else 'missing from response'}")
+            results[icao24] = None
+        else:
+            futures[icao24] = details_pool.submit(enrich_aircraft_details, icao24, data)
+    
+    for icao24, future in futures.items():
+        results[icao24] = future.result()
+    
+    return results
+
+def wait_for_hexdb_slot():
+    """Block until our next hexdb request slot so we never exceed its rate limit"""
+    global _hexdb_next_slot
+    with _hexdb_lock:
+        now = time.monotonic()
+        slot = max(now, _hexdb_next_slot)
+        _hexdb_next_slot = slot + HEXDB_MIN_INTERVAL
+    time.sleep(slot - now)
+
+# Candidate hexdb keys for each field, in order of preference
+_FIELD_ALIASES = {
+    'manufacturer': ('manufacturer', 'Manufacturer'),
+    'model': ('type', 'model', 'aircraft_type', 'Type', 'ICAOTypeCode'),
+    'registration': ('registration', 'reg', 'Registration'),
+    'operator': ('operator', 'owner', 'RegisteredOwners'),
+    'serialNumber': ('serial_number', 'serialnumber')
+}
+
+def pick(data, keys):
+    """Return the first truthy value in data among keys, or None"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
 def fetch_public_aircraft_data(icao24):
     """Fetch aircraft metadata from public sources (same as web interface)"""
     try:
         # Use hexdb API (same as web interface)
         url = f"https://hexdb.io/api/v1/aircraft/{icao24}"
-        response = requests.get(url, timeout=5)
+        wait_for_hexdb_slot()
+        response = http_session.get(url, timeout=5)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Parse hexdb response (same logic as web interface)
             aircraft = None
@@ -185,32 +351,26 @@ def fetch_public_aircraft_data(icao24):
                 aircraft = data
             
             if aircraft:
-                result = {
-                    'manufacturer': aircraft.get('manufacturer') or aircraft.get('Manufacturer'),
-                    'model': aircraft.get('type') or aircraft.get('model') or aircraft.get('aircraft_type') or aircraft.get('Type') or aircraft.get('ICAOTypeCode'),
-                    'registration': aircraft.get('registration') or aircraft.get('reg') or aircraft.get('Registration'),
-                    'operator': aircraft.get('operator') or aircraft.get('owner') or aircraft.get('RegisteredOwners'),
-                    'serialNumber': aircraft.get('serial_number') or aircraft.get('serialnumber')
-                }
-                
-                # Filter out None values
-                result = {k: v for k, v in result.items() if v is not None}
+                result = {}
+                for field, keys in _FIELD_ALIASES.items():
+                    value = pick(aircraft, keys)
+                    if value is not None:
+                        result[field] = value
                 
                 if result:
                     return result
         
         return None
         
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.debug(f"Error fetching public data for {icao24}: {str(e)}")
         return None
 
 def trigger_vestaboard_notifications(aircraft_list):
     """Trigger Vestaboard notifications for detected aircraft with detailed information"""
-    global notified_aircraft
-    
     try:
-        # Send notification for each aircraft
+        # Collect aircraft we haven't notified about yet
+        new_aircraft = []
         for aircraft in aircraft_list:
             icao24 = aircraft.get('icao24')
             if icao24:
@@ -219,69 +379,81 @@ def trigger_vestaboard_notifications(aircraft_list):
                     logger.debug(f"REPEAT Aircraft {icao24} already notified, skipping")
                     continue
                 
+                # The server flags aircraft it has already notified about
+                if aircraft.get('notified'):
+                    logger.debug(f"REPEAT Aircraft {icao24} already tracked by server, skipping")
+                    mark_notified(icao24)
+                    continue
+                
                 logger.info(f"NEW AIRCRAFT DETECTED: {icao24}")
                 logger.info(f"   Basic Info: {aircraft.get('callsign', 'N/A')} | Alt: {aircraft.get('altitude', 'N/A')} ft | Speed: {aircraft.get('speed', 'N/A')} knots")
                 logger.info(f"   Distance: {aircraft.get('distance', 'N/A')} km")
-                
-                # Get detailed aircraft information
-                detailed_aircraft = get_aircraft_details(icao24)
-                
-                # Merge basic and detailed data for best results
-                if detailed_aircraft:
-                    # Use detailed data as base, but fall back to basic data for missing fields
-                    notification_data = detailed_aircraft.copy()
-                    # Ensure we have basic flight data
-                    if notification_data.get('callsign') == 'N/A':
-                        notification_data['callsign'] = aircraft.get('callsign', 'N/A')
-                    if notification_data.get('altitude') == 'N/A':
-                        notification_data['altitude'] = aircraft.get('altitude', 'N/A')
-                    if notification_data.get('speed') == 'N/A':
-                        notification_data['speed'] = aircraft.get('speed', 'N/A')
-                    if notification_data.get('heading') == 'N/A':
-                        notification_data['heading'] = aircraft.get('heading', 'N/A')
-                    notification_data['distance'] = aircraft.get('distance', 'N/A')
+                new_aircraft.append(aircraft)
+        
+        # Get detailed aircraft information for all new aircraft in one request
+        all_details = get_aircraft_details_batch([aircraft['icao24'] for aircraft in new_aircraft])
+        
+        # Send notifications one at a time, in detection order; the board shows one message at a time
+        for aircraft in new_aircraft:
+            icao24 = aircraft['icao24']
+            detailed_aircraft = all_details.get(icao24)
+            
+            # Merge basic and detailed data for best results
+            if detailed_aircraft:
+                # Use detailed data as base, but fall back to basic data for missing fields
+                notification_data = detailed_aircraft.copy()
+                # Ensure we have basic flight data
+                if notification_data.get('callsign') == 'N/A':
+                    notification_data['callsign'] = aircraft.get('callsign', 'N/A')
+                if notification_data.get('altitude') == 'N/A':
+                    notification_data['altitude'] = aircraft.get('altitude', 'N/A')
+                if notification_data.get('speed') == 'N/A':
+                    notification_data['speed'] = aircraft.get('speed', 'N/A')
+                if notification_data.get('heading') == 'N/A':
+                    notification_data['heading'] = aircraft.get('heading', 'N/A')
+                notification_data['distance'] = aircraft.get('distance', 'N/A')
+            else:
+                # Use basic data if detailed data is not available
+                notification_data = aircraft.copy()
+            
+            # Call the Vestaboard notification endpoint
+            notification_url = f"{BASE_URL}/api/vestaboard/notify"
+            notification_payload = {
+                'aircraft': notification_data
+            }
+            
+            response = http_session.post(notification_url, json=notification_payload, timeout=10)
+            
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                if result.get('success') or result.get('status') == 'success':
+                    logger.info(f"OK Vestaboard notification sent for {icao24}")
+                    mark_notified(icao24)  # Mark as notified
                 else:
-                    # Use basic data if detailed data is not available
-                    notification_data = aircraft.copy()
-                
-                # Call the Vestaboard notification endpoint
-                notification_url = f"{BASE_URL}/api/vestaboard/notify"
-                notification_payload = {
-                    'aircraft': notification_data
-                }
-                
-                response = requests.post(notification_url, json=notification_payload, timeout=10)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get('success') or result.get('status') == 'success':
-                        logger.info(f"OK Vestaboard notification sent for {icao24}")
-                        notified_aircraft.add(icao24)  # Mark as notified
+                    logger.warning(f"WARNING Vestaboard notification failed for {icao24}: {result.get('error', 'Unknown error')}")
+            elif response.status_code == 500:
+                # Check if this is because aircraft is already tracked (which is normal)
+                try:
+                    result = orjson.loads(response.content)
+                    if "Failed to send notification" in result.get('error', ''):
+                        logger.info(f"INFO Aircraft {icao24} already tracked by server (normal)")
+                        mark_notified(icao24)  # Mark as notified to avoid retries
                     else:
-                        logger.warning(f"WARNING Vestaboard notification failed for {icao24}: {result.get('error', 'Unknown error')}")
-                elif response.status_code == 500:
-                    # Check if this is because aircraft is already tracked (which is normal)
-                    try:
-                        result = response.json()
-                        if "Failed to send notification" in result.get('error', ''):
-                            logger.info(f"INFO Aircraft {icao24} already tracked by server (normal)")
-                            notified_aircraft.add(icao24)  # Mark as notified to avoid retries
-                        else:
-                            logger.error(f"ERROR Server error for {icao24}: {result.get('error', 'Unknown error')}")
-                    except:
-                        logger.error(f"ERROR Server error for {icao24}: HTTP 500")
-                else:
-                    logger.error(f"ERROR Failed to send Vestaboard notification for {icao24}: HTTP {response.status_code}")
+                        logger.error(f"ERROR Server error for {icao24}: {result.get('error', 'Unknown error')}")
+                except ValueError:
+                    logger.error(f"ERROR Server error for {icao24}: HTTP 500")
+            else:
+                logger.error(f"ERROR Failed to send Vestaboard notification for {icao24}: HTTP {response.status_code}")
                     
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"Error triggering Vestaboard notifications: {str(e)}")
 
 def check_vestaboard_status():
     """Check Vestaboard connection status with detailed logging"""
     try:
-        response = requests.get(f"{BASE_URL}/api/vestaboard/status", timeout=10)
+        response = http_session.get(f"{BASE_URL}/api/vestaboard/status", timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             enabled = data.get('vestaboard_enabled', False)
             connected = data.get('vestaboard_connected', False)
             tracked_count = data.get('tracked_aircraft_count', 0)
@@ -291,17 +463,10 @@ def check_vestaboard_status():
         else:
             logger.error(f"Failed to get Vestaboard status: HTTP {response.status_code}")
             return False, False, 0
-    except Exception as e:
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"Error checking Vestaboard status: {str(e)}")
         return False, False, 0
 
-def clear_notified_aircraft():
-    """Clear the notified aircraft list periodically to allow re-notifications"""
-    global notified_aircraft
-    if len(notified_aircraft) > 100:  # Clear when we have too many tracked
-        logger.info(f"CLEAR Clearing notified aircraft list (had {len(notified_aircraft)} entries)")
-        notified_aircraft.clear()
-
 def print_statistics():
     """Print current statistics"""
     if stats['start_time']:
@@ -324,6 +489,16 @@ def print_statistics():
         
         logger.info("=" * 60)
 
+def lower_process_priority():
+    """Run the detector as a background task so it never competes with foreground work"""
+    if not hasattr(os, 'nice'):
+        return  # Not available on Windows
+    try:
+        os.nice(PROCESS_NICENESS)
+        logger.info(f"Process priority lowered (nice +{PROCESS_NICENESS})")
+    except OSError as e:
+        logger.warning(f"Could not lower process priority: {str(e)}")
+
 def main():
     """Main loop for automated detection with enhanced error handling"""
     logger.info("AIRPLANE Automated Flight Detection - Production Ready")
@@ -331,14 +506,16 @@ def main():
     logger.info(f"Location: ({YOUR_LAT}, {YOUR_LON})")
     logger.info(f"Radius: {YOUR_RADIUS} km")
     logger.info(f"Check interval: {CHECK_INTERVAL} seconds")
+    logger.info(f"Minimum fetch interval: {MIN_FETCH_INTERVAL} seconds")
     logger.info(f"Max retries: {MAX_RETRIES}")
-    logger.info(f"Retry delay: {RETRY_DELAY} seconds")
+    logger.info(f"Retry backoff factor: {RETRY_BACKOFF_FACTOR} seconds")
     logger.info("=" * 60)
     
     # Initialize statistics
     stats['start_time'] = datetime.now()
     
-    # Initial server health check
+    # Initial server health check; the Vestaboard status check is independent, so it runs alongside
+    status_future = details_pool.submit(check_vestaboard_status)
     server_healthy, health_data = check_server_health()
     if not server_healthy:
         logger.error("ERROR Flask server is not running or not responding")
@@ -348,7 +525,7 @@ def main():
     logger.info("OK Flask server is running and healthy")
     
     # Check Vestaboard status
-    vesta_enabled, vesta_connected, tracked_count = check_vestaboard_status()
+    vesta_enabled, vesta_connected, tracked_count = status_future.result()
     if vesta_enabled and vesta_connected:
         logger.info("OK Vestaboard connected - notifications will be sent")
         logger.info(f"   Currently tracking {tracked_count} aircraft")
@@ -364,6 +541,7 @@ def main():
     logger.info("Press Ctrl+C to stop gracefully")
     logger.info("")
     
+    interval = CHECK_INTERVAL
     try:
         while True:
             stats['checks_performed'] += 1
@@ -371,15 +549,20 @@ def main():
             # Check for aircraft
             aircraft_count = check_for_aircraft()
             
-            # Clear notified aircraft periodically
-            clear_notified_aircraft()
-
+            # Poll quickly while aircraft are around, back off when the sky is empty or on errors
+            if aircraft_count is None:
+                interval = min(interval * 2, MAX_CHECK_INTERVAL)
+            elif aircraft_count > 0:
+                interval = CHECK_INTERVAL
+            else:
+                interval = min(interval * 1.5, MAX_CHECK_INTERVAL)
+            
             # Log statistics every 100 checks
             if stats['checks_performed'] % 100 == 0:
                 print_statistics()
             
-            # Wait for next check
-            time.sleep(CHECK_INTERVAL)
+            # Wait for next check, jittered so multiple clients don't poll in lockstep
+            time.sleep(interval * random.uniform(0.8, 1.2))
             
     except KeyboardInterrupt:
         logger.info("")
@@ -393,4 +576,6 @@ def main():
         raise
 
 if __name__ == "__main__":
+    # Only when standalone: under start_auto_detection.py the Flask server shares this process
+    lower_process_priority()
     main() 
\ No newline at end of file
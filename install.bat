@@ -4,7 +4,7 @@ echo ================================================
 
 echo.
 echo 📦 Installing Python dependencies...
-pip install -r requirements.txt
+pip install -e .
 
 echo.
 echo 📝 Setting up configuration files...
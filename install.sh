@@ -5,7 +5,7 @@ echo "================================================"
 
 echo
 echo "📦 Installing Python dependencies..."
-pip3 install -r requirements.txt
+pip3 install -e .
 
 echo
 echo "📝 Setting up configuration files..."
@@ -6,14 +6,29 @@ Simple script to start the flight tracking application
 
 import sys
 import os
+import socket
 import webbrowser
 import time
-from threading import Timer
+from threading import Thread
+
+SERVER_ADDRESS = ('127.0.0.1', 5000)
+BROWSER_WAIT_TIMEOUT = 5  # seconds to wait for the server before opening the browser anyway
 
 def open_browser():
     """Open the web interface in the default browser"""
     webbrowser.open('http://localhost:5000')
 
+def open_browser_when_ready():
+    """Open the browser as soon as the server accepts connections"""
+    deadline = time.monotonic() + BROWSER_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(SERVER_ADDRESS, timeout=0.05).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    open_browser()
+
 def main():
     """Main launcher function"""
     print("🛩️  Air Overhead Flight Tracker")
@@ -27,13 +42,13 @@ def main():
         from app import app
         
         print("✅ Starting Flask server...")
-        print("🌐 Web interface will open automatically in 3 seconds...")
+        print("🌐 Web interface will open automatically once the server is ready...")
         print("📱 Access the app at: http://localhost:5000")
         print("🛑 Press Ctrl+C to stop the server")
         print("-" * 50)
         
-        # Open browser after 3 seconds
-        Timer(3.0, open_browser).start()
+        # Open browser once the server is listening
+        Thread(target=open_browser_when_ready, daemon=True).start()
         
         # Run the Flask app
         app.run(host='0.0.0.0', port=5000, debug=False)
@@ -12,11 +12,6 @@ def read_readme():
     with open("README.md", "r", encoding="utf-8") as fh:
         return fh.read()
 
-# Read requirements
-def read_requirements():
-    with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
-
 setup(
     name="air-overhead",
     version="1.0.0",
@@ -44,7 +39,14 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
     python_requires=">=3.7",
-    install_requires=read_requirements(),
+    # Keep in sync with [project].dependencies in pyproject.toml
+    install_requires=[
+        "Flask>=2.3.3",
+        "flask-cors>=4.0.0",
+        "requests>=2.31.0",
+        "cachetools>=5.0.0",
+        "orjson>=3.9.0",
+    ],
     extras_require={
         "dev": [
             "pytest>=6.0",
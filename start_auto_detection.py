@@ -1,135 +1,106 @@
 #!/usr/bin/env python3
 """
 Auto-Detection Startup Script
-This script starts both the Flask server and the auto-detection script together.
+This script runs the Flask server and the auto-detection loop together in one process.
 """
 
-import subprocess
+import importlib.util
+import logging
+import threading
 import time
 import sys
-import os
-from datetime import datetime
 
-def check_dependencies():
-    """Check if required files exist"""
-    required_files = [
-        'app.py',
-        'auto_detection.py',
-        'requirements.txt'
-    ]
-    
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
-    
-    if missing_files:
-        print("❌ Missing required files:")
-        for file in missing_files:
-            print(f"   - {file}")
-        return False
-    
-    return True
+SERVER_URL = "http://127.0.0.1:5000"
+SERVER_STARTUP_TIMEOUT = 10  # seconds to wait for the server to answer its health check
 
-def install_dependencies():
-    """Install Python dependencies"""
-    print("📦 Installing dependencies...")
-    try:
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], 
-                      check=True, capture_output=True, text=True)
-        print("✅ Dependencies installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install dependencies: {e}")
-        return False
+# Modules the server and detection loop import; install them once with `pip install -e .`
+REQUIRED_MODULES = ['flask', 'flask_cors', 'requests', 'cachetools', 'orjson']
+
+def missing_dependencies():
+    """Return the required modules that cannot be imported"""
+    return [module for module in REQUIRED_MODULES if importlib.util.find_spec(module) is None]
 
 def start_flask_server():
-    """Start the Flask server in the background"""
+    """Start the Flask server in a background thread of this process"""
     print("🚀 Starting Flask server...")
     try:
-        # Start Flask server in background
-        flask_process = subprocess.Popen([sys.executable, 'app.py'], 
-                                       stdout=subprocess.PIPE, 
-                                       stderr=subprocess.PIPE,
-                                       text=True)
+        # Import after the dependency check; auto_detection first so its logging setup applies
+        import requests
+        import auto_detection
+        from app import app
+        
+        # Keep per-request access logs out of the detection log
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
         
-        # Wait a moment for server to start
-        time.sleep(3)
+        server_thread = threading.Thread(
+            target=app.run,
+            kwargs={'host': '0.0.0.0', 'port': 5000, 'debug': False, 'use_reloader': False, 'threaded': True},
+            daemon=True
+        )
+        server_thread.start()
         
-        # Check if server is running
-        if flask_process.poll() is None:
-            print("✅ Flask server started successfully")
-            return flask_process
+        # Wait until the server answers its health check (or its thread dies, or we time out)
+        deadline = time.monotonic() + SERVER_STARTUP_TIMEOUT
+        while time.monotonic() < deadline and server_thread.is_alive():
+            try:
+                if requests.get(f"{SERVER_URL}/api/health", timeout=0.5).status_code == 200:
+                    print("✅ Flask server started successfully")
+                    return server_thread
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(0.1)
+        
+        if server_thread.is_alive():
+            print(f"❌ Flask server did not become ready within {SERVER_STARTUP_TIMEOUT} seconds")
         else:
-            stdout, stderr = flask_process.communicate()
-            print(f"❌ Flask server failed to start:")
-            print(f"   STDOUT: {stdout}")
-            print(f"   STDERR: {stderr}")
-            return None
+            print("❌ Flask server failed to start (see errors above)")
+        return None
     except Exception as e:
         print(f"❌ Error starting Flask server: {e}")
         return None
 
 def start_auto_detection():
-    """Start the auto-detection script"""
-    print("🛩️  Starting auto-detection script...")
+    """Run the auto-detection loop in this process until it stops"""
+    print("🛩️  Starting auto-detection...")
     try:
-        # Start auto-detection script
-        auto_process = subprocess.run([sys.executable, 'auto_detection.py'], 
-                                    check=True)
+        import auto_detection
+        auto_detection.main()
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Auto-detection script failed: {e}")
-        return False
     except KeyboardInterrupt:
         print("\n🛑 Auto-detection stopped by user")
         return True
+    except Exception as e:
+        print(f"❌ Auto-detection failed: {e}")
+        return False
 
 def main():
     """Main startup function"""
     print("🛩️  Air Overhead Auto-Detection Startup")
     print("=" * 50)
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     
-    # Check dependencies
-    if not check_dependencies():
-        print("\n❌ Please ensure all required files are present")
-        return 1
-    
-    # Install dependencies
-    if not install_dependencies():
-        print("\n❌ Failed to install dependencies")
+    # Check dependencies; installing them is a one-time setup step, not part of startup
+    missing = missing_dependencies()
+    if missing:
+        print(f"\n❌ Missing dependencies: {', '.join(missing)}")
+        print("   Install them with: pip install -e .")
         return 1
     
     # Start Flask server
-    flask_process = start_flask_server()
-    if not flask_process:
+    if not start_flask_server():
         print("\n❌ Failed to start Flask server")
         return 1
     
-    try:
-        # Start auto-detection
-        success = start_auto_detection()
-        
-        if success:
-            print("\n✅ Auto-detection completed successfully")
-            return 0
-        else:
-            print("\n❌ Auto-detection failed")
-            return 1
-            
-    finally:
-        # Clean up Flask server
-        if flask_process and flask_process.poll() is None:
-            print("\n🛑 Stopping Flask server...")
-            flask_process.terminate()
-            try:
-                flask_process.wait(timeout=5)
-                print("✅ Flask server stopped")
-            except subprocess.TimeoutExpired:
-                print("⚠️  Force killing Flask server...")
-                flask_process.kill()
+    # Start auto-detection; the server thread is a daemon and stops when we exit
+    success = start_auto_detection()
+    
+    if success:
+        print("\n✅ Auto-detection completed successfully")
+        return 0
+    else:
+        print("\n❌ Auto-detection failed")
+        return 1
 
 if __name__ == "__main__":
     try:
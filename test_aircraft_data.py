@@ -3,33 +3,79 @@
 Test script to check aircraft manufacturer and model data using enhanced auto-detection methods
 """
 
-import requests
-import json
+import orjson
 import sys
 import os
+import time
 
 # Add the current directory to the path so we can import from auto_detection
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import the enhanced functions from auto_detection
-from auto_detection import get_aircraft_details
+from auto_detection import get_aircraft_details_batch, http_session
+
+# Airframe details (registration, manufacturer, model) rarely change, so cache them per ICAO24
+# across runs instead of refetching them every time
+DETAILS_CACHE_FILE = 'aircraft_cache.json'
+DETAILS_CACHE_TTL = 86400  # 24 hours in seconds
+
+def load_details_cache():
+    """Load cached aircraft details as {icao24: [data, expiry_ts]}"""
+    try:
+        with open(DETAILS_CACHE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def save_details_cache(details_cache):
+    """Write unexpired cached aircraft details back to disk"""
+    now = time.time()
+    try:
+        with open(DETAILS_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps({icao24: entry for icao24, entry in details_cache.items() if entry[1] > now}))
+    except OSError as e:
+        print(f"⚠️  Could not save details cache: {str(e)}")
+
+def get_cached_aircraft_details(icao24_list, details_cache):
+    """Return {icao24: details}, fetching every cache miss in one bulk request"""
+    now = time.time()
+    results = {}
+    misses = []
+    for icao24 in icao24_list:
+        entry = details_cache.get(icao24)
+        if entry and now < entry[1]:
+            results[icao24] = entry[0]
+        else:
+            misses.append(icao24)
+    
+    if misses:
+        expiry = time.time() + DETAILS_CACHE_TTL
+        for icao24, data in get_aircraft_details_batch(misses).items():
+            if data:
+                details_cache[icao24] = [data, expiry]
+            results[icao24] = data
+    
+    return results
 
 def test_aircraft_data():
     """Test getting aircraft data with manufacturer and model information using enhanced methods"""
     
     # Test basic aircraft detection
     print("Testing aircraft detection with enhanced methods...")
-    url = "http://localhost:5000/api/aircraft?lat=51.5995&lon=-0.5545&radius=50"
+    url = "http://127.0.0.1:5000/api/aircraft?lat=51.5995&lon=-0.5545&radius=50"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = http_session.get(url, timeout=10)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 200:
-            aircraft_list = response.json()
+            aircraft_list = orjson.loads(response.content)
             print(f"Found {len(aircraft_list)} aircraft")
             
             if aircraft_list:
+                details_cache = load_details_cache()
+                all_details = get_cached_aircraft_details([aircraft.get('icao24') for aircraft in aircraft_list[:5]], details_cache)
+                
                 # Test detailed data for multiple aircraft using enhanced method
                 print(f"Testing enhanced detailed data for up to 5 aircraft...")
                 
@@ -38,8 +84,8 @@ def test_aircraft_data():
                     callsign = aircraft.get('callsign', 'N/A')
                     print(f"\n--- Aircraft {i+1}: {icao24} ({callsign}) ---")
                     
-                    # Use the enhanced get_aircraft_details function
-                    detailed_aircraft = get_aircraft_details(icao24)
+                    # Details were fetched in one bulk request above
+                    detailed_aircraft = all_details.get(icao24)
                     
                     if detailed_aircraft:
                         manufacturer = detailed_aircraft.get('manufacturer', 'N/A')
@@ -60,6 +106,8 @@ def test_aircraft_data():
                     else:
                         print(f"  ❌ Failed to get details")
                 
+                save_details_cache(details_cache)
+                
                 print(f"\n=== SUMMARY ===")
                 print(f"Tested {min(5, len(aircraft_list))} aircraft")
                 print(f"Total aircraft in area: {len(aircraft_list)}")
@@ -5,21 +5,38 @@ This script tests the Vestaboard notification functionality
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
-BASE_URL = "http://localhost:5000"
+BASE_URL = "http://127.0.0.1:5000"
 
-def test_health_endpoint():
+# One keep-alive session for all test requests to the local server
+session = requests.Session()
+session.mount('http://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
+
+# The four probes are independent, so they are sent together and reported in order
+probe_pool = ThreadPoolExecutor(max_workers=4)
+
+def start_probe(path):
+    """Send a GET for the given path in the background and return its future"""
+    return probe_pool.submit(session.get, f"{BASE_URL}{path}")
+
+def test_health_endpoint(probe=None):
     """Test the health endpoint to check Vestaboard status"""
     print("🔍 Testing health endpoint...")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/health")
+        response = (probe or start_probe("/api/health")).result()
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Health check passed")
             print(f"   Vestaboard enabled: {data.get('vestaboard_enabled', False)}")
             print(f"   Vestaboard connected: {data.get('vestaboard_connected', False)}")
@@ -32,14 +49,14 @@ def test_health_endpoint():
         print(f"❌ Health check error: {str(e)}")
         return None
 
-def test_vestaboard_status():
+def test_vestaboard_status(probe=None):
     """Test the Vestaboard status endpoint"""
     print("\n🔍 Testing Vestaboard status endpoint...")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/vestaboard/status")
+        response = (probe or start_probe("/api/vestaboard/status")).result()
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Vestaboard status retrieved")
             print(f"   Enabled: {data.get('vestaboard_enabled', False)}")
             print(f"   Connected: {data.get('vestaboard_connected', False)}")
@@ -54,40 +71,42 @@ def test_vestaboard_status():
         print(f"❌ Vestaboard status error: {str(e)}")
         return None
 
-def test_vestaboard_connection():
+def test_vestaboard_connection(probe=None):
     """Test Vestaboard connection and send test message"""
     print("\n🔍 Testing Vestaboard connection...")
     
     try:
-        response = requests.get(f"{BASE_URL}/api/vestaboard/test")
+        response = (probe or start_probe("/api/vestaboard/test")).result()
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Vestaboard test successful")
             print(f"   Message: {data.get('message', 'Unknown')}")
             return True
         else:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"❌ Vestaboard test failed: {data.get('error', 'Unknown error')}")
             return False
     except Exception as e:
         print(f"❌ Vestaboard test error: {str(e)}")
         return False
 
-def test_flight_detection():
-    """Test flight detection with a sample location"""
-    print("\n🔍 Testing flight detection...")
-    
+def flight_detection_path():
+    """Aircraft query used by the flight detection test"""
     # Test coordinates (New York area)
     test_lat = 40.7128
     test_lon = -74.0060
     test_radius = 10
+    return f"/api/aircraft?lat={test_lat}&lon={test_lon}&radius={test_radius}"
+
+def test_flight_detection(probe=None):
+    """Test flight detection with a sample location"""
+    print("\n🔍 Testing flight detection...")
     
     try:
-        url = f"{BASE_URL}/api/aircraft?lat={test_lat}&lon={test_lon}&radius={test_radius}"
-        response = requests.get(url)
+        response = (probe or start_probe(flight_detection_path())).result()
         
         if response.status_code == 200:
-            aircraft_list = response.json()
+            aircraft_list = orjson.loads(response.content)
             print(f"✅ Flight detection successful")
             print(f"   Found {len(aircraft_list)} aircraft")
             
@@ -101,32 +120,78 @@ def test_flight_detection():
             
             return aircraft_list
         else:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"❌ Flight detection failed: {data.get('error', 'Unknown error')}")
             return None
     except Exception as e:
         print(f"❌ Flight detection error: {str(e)}")
         return None
 
+def test_stream_shaped_notification():
+    """Format an unenriched aircraft, shaped like an /api/aircraft/stream line, without sending it"""
+    print("\n🔍 Testing notification formatting with unenriched aircraft data...")
+    
+    # Enrichment fields are present but null when no aircraft details were available
+    aircraft = {
+        'icao24': 'fff0de',
+        'callsign': None,
+        'country': None,
+        'latitude': 51.5995,
+        'longitude': -0.5545,
+        'altitude': None,
+        'speed': None,
+        'heading': None,
+        'verticalRate': None,
+        'onGround': False,
+        'distance': 1.2,
+        'notified': False,
+        'manufacturer': None,
+        'model': None,
+        'registration': None,
+        'operator': None,
+        'owner': None,
+        'flightNumber': None,
+        'route': None
+    }
+    
+    try:
+        # Imported here so the HTTP tests still run when the app's dependencies are missing
+        from app import format_flight_notification
+        message = format_flight_notification(aircraft)
+        print(f"✅ Unenriched notification formatted ({len(message)} characters)")
+        return True
+    except Exception as e:
+        print(f"❌ Unenriched notification error: {str(e)}")
+        return False
+
 def main():
     """Run all tests"""
     print("🛩️  Vestaboard Integration Test")
     print("=" * 50)
     print(f"Testing against: {BASE_URL}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     
+    # Fire all requests up front; total wait is the slowest endpoint, not the sum
+    health_probe = start_probe("/api/health")
+    status_probe = start_probe("/api/vestaboard/status")
+    connection_probe = start_probe("/api/vestaboard/test")
+    flight_probe = start_probe(flight_detection_path())
+    
     # Test 1: Health endpoint
-    health_data = test_health_endpoint()
+    health_data = test_health_endpoint(health_probe)
     
     # Test 2: Vestaboard status
-    status_data = test_vestaboard_status()
+    status_data = test_vestaboard_status(status_probe)
     
     # Test 3: Vestaboard connection test
-    connection_ok = test_vestaboard_connection()
+    connection_ok = test_vestaboard_connection(connection_probe)
     
     # Test 4: Flight detection (this should trigger Vestaboard notifications)
-    aircraft_list = test_flight_detection()
+    aircraft_list = test_flight_detection(flight_probe)
+    
+    # Test 5: Notification for an aircraft without enrichment data
+    unenriched_ok = test_stream_shaped_notification()
     
     # Summary
     print("\n" + "=" * 50)
@@ -158,6 +223,11 @@ def main():
     else:
         print(f"❌ Flight detection: Failed")
     
+    if unenriched_ok:
+        print(f"✅ Unenriched notification: Working")
+    else:
+        print(f"❌ Unenriched notification: Failed")
+    
     print("\n💡 Next steps:")
     print("   1. Check your Vestaboard for test messages")
     print("   2. If aircraft were found, check for flight notifications")
@@ -20,11 +20,98 @@ Usage:
     
     # Read current board content
     content = vesta.read_board()
+    
+    # From asyncio code, use the async client
+    from vestaboard_api import AsyncVestaboardAPI
+    vesta = AsyncVestaboardAPI("your_api_key_here")
+    await vesta.send_message("Hello World!")
 """
 
+import asyncio
+import codecs
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import List, Dict, Optional, Union
+import logging
+import threading
+from typing import Iterable, List, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # Optional; the client only needs requests
+    orjson = None
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+def _blank_unencodable(error):
+    """Codec error handler: characters the board cannot display become blanks."""
+    return '\x00' * (error.end - error.start), error.end
+
+logger = logging.getLogger(__name__)
+
+codecs.register_error('vestaboard_blank', _blank_unencodable)
+
+# One connection pool shared by every client, so re-created clients reuse warm connections
+_SHARED_SESSION = requests.Session()
+_SHARED_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.1))
+_SHARED_SESSION.mount('http://', _SHARED_ADAPTER)
+_SHARED_SESSION.mount('https://', _SHARED_ADAPTER)
+
+def _build_decode_tables(char_codes: Dict[str, int]) -> Tuple[bytes, Dict[int, str]]:
+    """
+    Build the decoding tables for VestaboardAPI, the reverse of the encoding tables.
+    
+    A 256-entry bytes.translate table maps each code to its Latin-1 character
+    (unknown codes decode as spaces); colour chips map to C1 sentinels that a
+    str.translate table then turns back into the emoji.
+    
+    Returns:
+        Tuple[bytes, Dict[int, str]]: bytes.translate table and str.translate table
+    """
+    decode_table = bytearray(b' ' * 256)
+    glyph_translation = {}
+    sentinel = 0x80
+    for char, code in char_codes.items():
+        if ord(char) < 256:
+            decode_table[code] = ord(char)
+        else:
+            decode_table[code] = sentinel
+            glyph_translation[sentinel] = char
+            sentinel += 1
+    return bytes(decode_table), glyph_translation
+
+def _build_encode_tables(char_codes: Dict[str, int]) -> Tuple[Dict[int, int], bytes]:
+    """
+    Build the encoding tables for VestaboardAPI.
+    
+    Text is first translated so every supported glyph fits in one Latin-1 byte
+    (colour chips borrow the unused C1 control range), then a 256-entry table maps
+    each byte to its board code (lowercase folded onto uppercase).
+    
+    Returns:
+        Tuple[Dict[int, int], bytes]: str.translate table and bytes.translate table
+    """
+    encode_table = bytearray(256)
+    glyph_translation = {}
+    sentinel = 0x80
+    for char, code in char_codes.items():
+        if ord(char) < 256:
+            encode_table[ord(char)] = code
+            encode_table[ord(char.lower())] = code
+        else:
+            glyph_translation[ord(char)] = sentinel
+            glyph_translation[sentinel] = 0  # A literal C1 character stays blank
+            encode_table[sentinel] = code
+            sentinel += 1
+    return glyph_translation, bytes(encode_table)
 
 class VestaboardAPI:
     """
@@ -32,8 +119,44 @@ class VestaboardAPI:
     
     Provides a simple interface for reading from and writing to Vestaboard displays
     using the Local API.
+    
+    All clients share one module-level requests session that lives for the whole
+    process; close() only forgets this client's record of the last message sent.
     """
     
+    # Per-client state only; the lookup tables below are shared class attributes
+    __slots__ = ('api_key', 'base_url', 'headers', 'session', '_message_url', '_session_post', '_last_sent', '_send_lock')
+    
+    # Vestaboard character codes mapping
+    char_codes = {
+        ' ': 0,   # Blank
+        'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9, 'J': 10,
+        'K': 11, 'L': 12, 'M': 13, 'N': 14, 'O': 15, 'P': 16, 'Q': 17, 'R': 18, 'S': 19, 'T': 20,
+        'U': 21, 'V': 22, 'W': 23, 'X': 24, 'Y': 25, 'Z': 26,
+        '1': 27, '2': 28, '3': 29, '4': 30, '5': 31, '6': 32, '7': 33, '8': 34, '9': 35, '0': 36,
+        '!': 37, '@': 38, '#': 39, '$': 40, '(': 41, ')': 42, '-': 44, '+': 46, '&': 47, '=': 48,
+        ';': 49, ':': 50, "'": 52, '"': 53, '%': 54, ',': 55, '.': 56, '/': 59, '?': 60, '°': 62,
+        # Color chips
+        '🔴': 63,  # Red
+        '🟠': 64,  # Orange  
+        '🟡': 65,  # Yellow
+        '🟢': 66,  # Green
+        '🔵': 67,  # Blue
+        '🟣': 68,  # Violet
+        '⚪': 69,  # White
+        '⚫': 70,  # Black
+    }
+    
+    # Lookup tables derived from char_codes, built once at import and shared by all clients
+    _decode_table, _decode_glyphs = _build_decode_tables(char_codes)
+    _glyph_translation, _encode_table = _build_encode_tables(char_codes)
+    
+    # Serialized all-blank message used by clear_board; it never changes
+    _BLANK_JSON = _dumps({"characters": [[0] * 22 for _ in range(6)]})
+    
+    # JSON text for every code the encoder can produce, for building bodies without orjson
+    _CODE_JSON = [str(code).encode() for code in range(256)]
+    
     def __init__(self, api_key: str, base_url: str = "http://192.168.1.70:7000"):
         """
         Initialize the Vestaboard API client.
@@ -49,40 +172,45 @@ class VestaboardAPI:
             "X-Vestaboard-Local-Api-Key": api_key
         }
         
-        # Vestaboard character codes mapping
-        self.char_codes = {
-            ' ': 0,   # Blank
-            'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8, 'I': 9, 'J': 10,
-            'K': 11, 'L': 12, 'M': 13, 'N': 14, 'O': 15, 'P': 16, 'Q': 17, 'R': 18, 'S': 19, 'T': 20,
-            'U': 21, 'V': 22, 'W': 23, 'X': 24, 'Y': 25, 'Z': 26,
-            '1': 27, '2': 28, '3': 29, '4': 30, '5': 31, '6': 32, '7': 33, '8': 34, '9': 35, '0': 36,
-            '!': 37, '@': 38, '#': 39, '$': 40, '(': 41, ')': 42, '-': 44, '+': 46, '&': 47, '=': 48,
-            ';': 49, ':': 50, "'": 52, '"': 53, '%': 54, ',': 55, '.': 56, '/': 59, '?': 60, '°': 62,
-            # Color chips
-            '🔴': 63,  # Red
-            '🟠': 64,  # Orange  
-            '🟡': 65,  # Yellow
-            '🟢': 66,  # Green
-            '🔵': 67,  # Blue
-            '🟣': 68,  # Violet
-            '⚪': 69,  # White
-            '⚫': 70,  # Black
-        }
+        # Shared keep-alive session; the API key is per client, so headers go with each request
+        self.session = _SHARED_SESSION
+        
+        # Bound once; every read and write goes to the same endpoint
+        self._message_url = f"{self.base_url}/local-api/message"
+        self._session_post = self.session.post
         
-        # Reverse mapping for decoding
-        self.code_to_char = {v: k for k, v in self.char_codes.items()}
+        # Body of the last message the board accepted; resending it would not change the board
+        self._last_sent: Optional[bytes] = None
+        # Makes the unchanged check, the POST and the _last_sent update one step, so
+        # concurrent sends (threads, AsyncVestaboardAPI) neither skip nor duplicate a message
+        self._send_lock = threading.Lock()
     
-    def _text_to_character_codes(self, text: str, max_lines: int = 6, max_chars: int = 22) -> List[List[int]]:
+    def close(self):
+        """Forget the last message sent, so the next send always reaches the board."""
+        with self._send_lock:
+            self._last_sent = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    # Dashboards tend to resend the same text, so the encoded grid and the serialized
+    # request body are both memoized; the tables are shared, so one cache serves all clients
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _encode(text: str, max_lines: int, max_chars: int) -> Tuple[Tuple[int, ...], ...]:
         """
-        Convert text to Vestaboard character codes.
+        Convert text to an immutable grid of character codes (memoized).
         
         Args:
             text (str): Text to convert
-            max_lines (int): Maximum number of lines (default: 6)
-            max_chars (int): Maximum characters per line (default: 22)
+            max_lines (int): Maximum number of lines
+            max_chars (int): Maximum characters per line
             
         Returns:
-            List[List[int]]: 2D array of character codes
+            Tuple[Tuple[int, ...], ...]: 2D grid of character codes
         """
         # Split text into lines
         lines = text.split('\n')
@@ -91,28 +219,49 @@ class VestaboardAPI:
         lines = lines[:max_lines]
         
         # Convert each line to character codes
+        glyph_translation = VestaboardAPI._glyph_translation
+        encode_table = VestaboardAPI._encode_table
         character_lines = []
         for line in lines:
-            # Convert string to Vestaboard codes
-            codes = []
-            for char in line[:max_chars]:
-                upper_char = char.upper()
-                if upper_char in self.char_codes:
-                    codes.append(self.char_codes[upper_char])
-                else:
-                    codes.append(0)  # Blank for unknown characters
+            # Whole line in three C-level passes; unknown characters become blanks (0)
+            encoded = (line[:max_chars]
+                       .translate(glyph_translation)
+                       .encode('latin-1', 'vestaboard_blank')
+                       .translate(encode_table))
             
             # Pad with zeros to reach max_chars
-            while len(codes) < max_chars:
-                codes.append(0)
-            
-            character_lines.append(codes)
+            character_lines.append(tuple(encoded) + (0,) * (max_chars - len(encoded)))
         
         # Pad with empty lines to reach max_lines
-        while len(character_lines) < max_lines:
-            character_lines.append([0] * max_chars)
+        character_lines.extend([(0,) * max_chars] * (max_lines - len(character_lines)))
+        
+        return tuple(character_lines)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _message_body(text: str) -> bytes:
+        """Build the JSON request body for a text message (memoized)."""
+        rows = VestaboardAPI._encode(text, 6, 22)
+        if orjson is not None:
+            return orjson.dumps({"characters": rows})
         
-        return character_lines
+        # Without orjson, assemble the body straight from the precomputed code strings
+        code_json = VestaboardAPI._CODE_JSON
+        return b'{"characters":[[' + b'],['.join(b','.join([code_json[c] for c in row]) for row in rows) + b']]}'
+    
+    def _text_to_character_codes(self, text: str, max_lines: int = 6, max_chars: int = 22) -> List[List[int]]:
+        """
+        Convert text to Vestaboard character codes.
+        
+        Args:
+            text (str): Text to convert
+            max_lines (int): Maximum number of lines (default: 6)
+            max_chars (int): Maximum characters per line (default: 22)
+            
+        Returns:
+            List[List[int]]: 2D array of character codes
+        """
+        return [list(row) for row in self._encode(text, max_lines, max_chars)]
     
     def _character_codes_to_text(self, character_codes: List[List[int]]) -> str:
         """
@@ -124,22 +273,39 @@ class VestaboardAPI:
         Returns:
             str: Converted text
         """
+        decode_table = self._decode_table
+        decode_glyphs = self._decode_glyphs
         lines = []
         for line in character_codes:
-            text_line = ""
-            for code in line:
-                if code in self.code_to_char:
-                    text_line += self.code_to_char[code]
-                else:
-                    text_line += " "  # Space for unknown codes
-            lines.append(text_line.rstrip())
+            try:
+                raw = bytes(line)
+            except (ValueError, TypeError):
+                # Codes that are not ints in 0-255 (None, floats, ...) are not board characters; show them as blanks
+                raw = bytes(code if isinstance(code, int) and 0 <= code < 256 else 0 for code in line)
+            lines.append(raw.translate(decode_table).decode('latin-1').translate(decode_glyphs).rstrip())
         
         return '\n'.join(lines)
     
+    def _log_error(self, action: str, response=None, exc: Optional[Exception] = None):
+        """
+        Log a failed board request; kept out of line so the success paths stay short.
+        
+        Args:
+            action (str): What was being attempted, e.g. "reading board"
+            response: The unexpected HTTP response, if one was received
+            exc (Exception): The request exception, if the request failed
+        """
+        if exc is not None:
+            logger.error("Error %s: %s", action, exc)
+        else:
+            logger.error("Error %s: HTTP %s", action, response.status_code)
+    
     def send_message(self, text: str) -> bool:
         """
         Send a text message to the Vestaboard.
         
+        If this client's last successful send was the same message, no request is made.
+        
         Args:
             text (str): Text message to display (supports \n for line breaks)
             
@@ -151,23 +317,31 @@ class VestaboardAPI:
             vesta.send_message("Line 1\nLine 2\nLine 3")
             vesta.send_message("Hello 🔴 World 🟢!")
         """
-        url = f"{self.base_url}/local-api/message"
-        
-        # Convert text to character codes
-        character_codes = self._text_to_character_codes(text)
-        data = {"characters": character_codes}
+        # Convert text to character codes and serialize (cached for repeated text)
+        return self._post_json_bytes(self._message_body(text))
+    
+    @classmethod
+    def send_many(cls, clients_and_messages: Iterable[Tuple["VestaboardAPI", str]]) -> List[bool]:
+        """
+        Send messages to several Vestaboards at once.
         
-        try:
-            response = requests.post(url, headers=self.headers, json=data, timeout=10)
+        Args:
+            clients_and_messages: (client, text) pairs, one per board
             
-            if response.status_code == 201:
-                return True
-            else:
-                print(f"Error sending message: HTTP {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"Error sending message: {str(e)}")
-            return False
+        Returns:
+            List[bool]: Success of each send, in the same order as the input
+            
+        Example:
+            VestaboardAPI.send_many([(kitchen, "Hello"), (office, "World")])
+        """
+        pairs = list(clients_and_messages)
+        if not pairs:
+            return []
+        
+        # Requests release the GIL while waiting on the network, so the total time
+        # is that of the slowest board rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            return list(executor.map(lambda pair: pair[0].send_message(pair[1]), pairs))
     
     def read_board(self) -> Optional[str]:
         """
@@ -181,23 +355,18 @@ class VestaboardAPI:
             if content:
                 print(f"Current board: {content}")
         """
-        url = f"{self.base_url}/local-api/message"
-        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(self._message_url, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _loads(response.content)
                 if 'message' in result:
                     return self._character_codes_to_text(result['message'])
-                else:
-                    return None
-            else:
-                print(f"Error reading board: HTTP {response.status_code}")
                 return None
-        except Exception as e:
-            print(f"Error reading board: {str(e)}")
-            return None
+            self._log_error("reading board", response=response)
+        except (requests.RequestException, ValueError) as e:
+            self._log_error("reading board", exc=e)
+        return None
     
     def get_board_raw(self) -> Optional[Dict]:
         """
@@ -206,19 +375,15 @@ class VestaboardAPI:
         Returns:
             Optional[Dict]: Raw board data, or None if failed
         """
-        url = f"{self.base_url}/local-api/message"
-        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(self._message_url, headers=self.headers, timeout=10)
             
             if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"Error reading board: HTTP {response.status_code}")
-                return None
-        except Exception as e:
-            print(f"Error reading board: {str(e)}")
-            return None
+                return _loads(response.content)
+            self._log_error("reading board", response=response)
+        except (requests.RequestException, ValueError) as e:
+            self._log_error("reading board", exc=e)
+        return None
     
     def send_raw_codes(self, character_codes: List[List[int]]) -> bool:
         """
@@ -235,19 +400,51 @@ class VestaboardAPI:
             codes = [[8, 5, 12, 12, 15] + [0] * 17] + [[0] * 22] * 5
             vesta.send_raw_codes(codes)
         """
-        url = f"{self.base_url}/local-api/message"
-        data = {"characters": character_codes}
+        return self._post_characters(character_codes, "sending raw codes")
+    
+    def _post_characters(self, character_codes, action: str = "sending message") -> bool:
+        """
+        Serialize a grid of character codes and send it to the Vestaboard.
         
-        try:
-            response = requests.post(url, headers=self.headers, json=data, timeout=10)
+        Args:
+            character_codes: 2D array of character codes
+            action (str): Description used in error logs
             
-            if response.status_code == 201:
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._post_json_bytes(_dumps({"characters": character_codes}), action)
+    
+    def _post_json_bytes(self, body: bytes, action: str = "sending message") -> bool:
+        """
+        Send an already-serialized message payload to the Vestaboard.
+        
+        The POST is skipped when the board already shows this exact payload from
+        our last successful send.
+        
+        Args:
+            body (bytes): JSON request body
+            action (str): Description used in error logs
+            
+        Returns:
+            bool: True if successful (or nothing to change), False otherwise
+        """
+        with self._send_lock:
+            if body == self._last_sent:
                 return True
-            else:
-                print(f"Error sending raw codes: HTTP {response.status_code}")
-                return False
-        except Exception as e:
-            print(f"Error sending raw codes: {str(e)}")
+            
+            # Until this send succeeds the board's content is unknown
+            self._last_sent = None
+            try:
+                # self.headers already carries Content-Type: application/json
+                response = self._session_post(self._message_url, headers=self.headers, data=body, timeout=10)
+                
+                if response.status_code == 201:
+                    self._last_sent = body
+                    return True
+                self._log_error(action, response=response)
+            except requests.RequestException as e:
+                self._log_error(action, exc=e)
             return False
     
     def clear_board(self) -> bool:
@@ -257,8 +454,7 @@ class VestaboardAPI:
         Returns:
             bool: True if successful, False otherwise
         """
-        blank_codes = [[0] * 22 for _ in range(6)]
-        return self.send_raw_codes(blank_codes)
+        return self._post_json_bytes(self._BLANK_JSON)
     
     def test_connection(self) -> bool:
         """
@@ -273,6 +469,59 @@ class VestaboardAPI:
         except:
             return False
 
+class AsyncVestaboardAPI:
+    """
+    asyncio front end for VestaboardAPI.
+    
+    Each call runs the blocking client in the event loop's default executor, so
+    Vestaboard I/O overlaps with other awaitables instead of stalling the loop.
+    Encoding caches and the shared connection pool are those of VestaboardAPI.
+    
+    Usage:
+        vesta = AsyncVestaboardAPI("your_api_key_here")
+        await vesta.send_message("Hello World!")
+    """
+    
+    __slots__ = ('client',)
+    
+    def __init__(self, api_key: str, base_url: str = "http://192.168.1.70:7000"):
+        """
+        Initialize the async Vestaboard API client.
+        
+        Args:
+            api_key (str): Your Vestaboard Local API key
+            base_url (str): Base URL of your Vestaboard (default: your board's IP)
+        """
+        self.client = VestaboardAPI(api_key, base_url)
+    
+    async def _run(self, func, *args):
+        """Run a blocking client method without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    async def send_message(self, text: str) -> bool:
+        """Async version of VestaboardAPI.send_message."""
+        return await self._run(self.client.send_message, text)
+    
+    async def send_raw_codes(self, character_codes: List[List[int]]) -> bool:
+        """Async version of VestaboardAPI.send_raw_codes."""
+        return await self._run(self.client.send_raw_codes, character_codes)
+    
+    async def read_board(self) -> Optional[str]:
+        """Async version of VestaboardAPI.read_board."""
+        return await self._run(self.client.read_board)
+    
+    async def get_board_raw(self) -> Optional[Dict]:
+        """Async version of VestaboardAPI.get_board_raw."""
+        return await self._run(self.client.get_board_raw)
+    
+    async def clear_board(self) -> bool:
+        """Async version of VestaboardAPI.clear_board."""
+        return await self._run(self.client.clear_board)
+    
+    async def test_connection(self) -> bool:
+        """Async version of VestaboardAPI.test_connection."""
+        return await self._run(self.client.test_connection)
+
 # Example usage and testing
 if __name__ == "__main__":
     # Your API key